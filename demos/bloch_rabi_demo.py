@@ -16,7 +16,8 @@ import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.animation import FuncAnimation
 import qutip as qt
-from tqdm import tqdm
+import cmath
+import math
 import warnings
 
 # Suppress numerical warnings for cleaner output
@@ -34,15 +35,69 @@ except OSError:
 plt.rcParams['figure.figsize'] = (12, 8)
 plt.rcParams['font.size'] = 12
 
+# Constant single-qubit operators and basis states, built once at import time
+# so the observable loops below don't reconstruct a Qobj on every call
+_SX, _SY, _SZ = qt.sigmax(), qt.sigmay(), qt.sigmaz()
+_G, _E = qt.basis(2, 0), qt.basis(2, 1)
+
+# Single-qubit gates
+_I2 = qt.qeye(2)
+_H = (_SX + _SZ) / math.sqrt(2)
+_S = qt.qdiags([1, 1j], 0)
+_T = qt.qdiags([1, cmath.exp(1j*math.pi/4)], 0)
+
+# Closed-system solves don't need QuTiP 5's per-step output renormalization
+_SOLVER_OPTS = {"normalize_output": False}
+
+# Dense Pauli stack used to batch <σx>, <σy>, <σz> over a whole trajectory
+_PAULI = np.stack([_SX.full(), _SY.full(), _SZ.full()])
+
+def stack_kets(states):
+    """Stack a list of qubit kets into a (2, T) complex array."""
+    if any(state.dims != [[2], [1]] for state in states):
+        raise ValueError("stack_kets expects single-qubit kets")
+    return np.stack([state.full().ravel() for state in states], axis=1)
+
+def bloch_vectors_from_kets(psi):
+    """
+    Compute the Bloch vectors of a stacked ket trajectory.
+    
+    Parameters:
+    psi: (2, T) complex array of state amplitudes
+    
+    Returns a (T, 3) array of [<σx>, <σy>, <σz>] per time step.
+    """
+    # <σk>(t) = ψ(t)† σk ψ(t), evaluated for all k and t in one einsum
+    bloch = np.einsum('ik,nij,jk->nk', psi.conj(), _PAULI, psi, optimize=True)
+    return np.real(bloch).T
+
+def precession_kets(omega, psi0, t_points):
+    """
+    Closed-form evolution under a static Hamiltonian H = (ω·σ)/2.
+    
+    Parameters:
+    omega: (ωx, ωy, ωz) components of the precession vector
+    psi0: initial two-level ket
+    t_points: array of times
+    
+    Returns a (2, T) complex array of state amplitudes, matching stack_kets.
+    """
+    # U(t) = cos(Ωt/2) I - i sin(Ωt/2) n̂·σ with Ω = |ω| and n̂ = ω/Ω
+    Omega = math.hypot(*omega)
+    n_sigma = np.einsum('k,kij->ij', omega, _PAULI) / Omega if Omega else np.zeros((2, 2))
+    psi0 = psi0.full().ravel()
+    phase = Omega * np.asarray(t_points) / 2
+    return np.outer(psi0, np.cos(phase)) - 1j*np.outer(n_sigma @ psi0, np.sin(phase))
+
 def create_initial_states():
     """Create various interesting initial quantum states."""
     states = {
-        'ground': qt.basis(2, 0),                    # |0⟩
-        'excited': qt.basis(2, 1),                   # |1⟩
-        'plus': (qt.basis(2, 0) + qt.basis(2, 1)).unit(),      # |+⟩ = (|0⟩ + |1⟩)/√2
-        'minus': (qt.basis(2, 0) - qt.basis(2, 1)).unit(),     # |-⟩ = (|0⟩ - |1⟩)/√2
-        'right': (qt.basis(2, 0) + 1j*qt.basis(2, 1)).unit(), # |R⟩ = (|0⟩ + i|1⟩)/√2
-        'left': (qt.basis(2, 0) - 1j*qt.basis(2, 1)).unit(),  # |L⟩ = (|0⟩ - i|1⟩)/√2
+        'ground': _G,                    # |0⟩
+        'excited': _E,                   # |1⟩
+        'plus': (_G + _E).unit(),        # |+⟩ = (|0⟩ + |1⟩)/√2
+        'minus': (_G - _E).unit(),       # |-⟩ = (|0⟩ - |1⟩)/√2
+        'right': (_G + 1j*_E).unit(),    # |R⟩ = (|0⟩ + i|1⟩)/√2
+        'left': (_G - 1j*_E).unit(),     # |L⟩ = (|0⟩ - i|1⟩)/√2
     }
     return states
 
@@ -54,16 +109,19 @@ def rabi_hamiltonian(omega_0, omega_rabi):
     omega_0: qubit frequency
     omega_rabi: Rabi frequency (coupling strength)
     """
-    # Pauli matrices
-    sigma_z = qt.sigmaz()
-    sigma_x = qt.sigmax()
-    
     # Hamiltonian: H = ω₀/2 σz + ΩR/2 σx
-    H = omega_0/2 * sigma_z + omega_rabi/2 * sigma_x
+    H = omega_0/2 * _SZ + omega_rabi/2 * _SX
     return H
 
-def simulate_rabi_oscillations():
-    """Simulate and visualize Rabi oscillations."""
+def simulate_rabi_oscillations(use_numerical=False):
+    """
+    Simulate and visualize Rabi oscillations.
+    
+    Parameters:
+    use_numerical: integrate with sesolve instead of the closed-form propagator
+    
+    Returns the (2, T) state amplitudes and the time grid.
+    """
     print("🎯 Simulating Rabi Oscillations...")
     
     # Parameters
@@ -75,29 +133,32 @@ def simulate_rabi_oscillations():
     t_points = np.linspace(0, t_max, 200)
     
     # Initial state: ground state
-    psi0 = qt.basis(2, 0)
-    
-    # Hamiltonian
-    H = rabi_hamiltonian(omega_0, omega_rabi)
-    
-    # Solve the Schrödinger equation
-    print("Solving Schrödinger equation...")
-    result = qt.mesolve(H, psi0, t_points, [], [])
+    psi0 = _G
+    
+    if use_numerical:
+        # Solve the Schrödinger equation
+        print("Solving Schrödinger equation...")
+        H = rabi_hamiltonian(omega_0, omega_rabi)
+        result = qt.sesolve(H, psi0, t_points, options=_SOLVER_OPTS)
+        psi = stack_kets(result.states)
+    else:
+        # H is static, so the propagator is known in closed form
+        print("Evaluating closed-form evolution...")
+        psi = precession_kets((omega_rabi, 0.0, omega_0), psi0, t_points)
     
     # Calculate populations
-    P_ground = []
-    P_excited = []
-    
-    for state in tqdm(result.states, desc="Calculating populations"):
-        P_ground.append(qt.expect(qt.num(2), state))  # Population of excited state
-        P_excited.append(1 - P_ground[-1])  # Population of ground state
+    P_excited = np.abs(psi[1])**2  # Population of excited state
+    P_ground = 1 - P_excited       # Population of ground state
     
     # Create the plot
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 6))
+    # The Bloch sphere needs a 3D axes, so the panels are added one by one
+    fig = plt.figure(figsize=(15, 6))
+    ax1 = fig.add_subplot(1, 2, 1)
+    ax2 = fig.add_subplot(1, 2, 2, projection='3d')
     
     # Plot 1: Population dynamics
-    ax1.plot(t_points, P_excited, 'b-', linewidth=2, label='Ground |0⟩')
-    ax1.plot(t_points, P_ground, 'r-', linewidth=2, label='Excited |1⟩')
+    ax1.plot(t_points, P_ground, 'b-', linewidth=2, label='Ground |0⟩')
+    ax1.plot(t_points, P_excited, 'r-', linewidth=2, label='Excited |1⟩')
     ax1.set_xlabel('Time (1/ω₀)')
     ax1.set_ylabel('Population')
     ax1.set_title('Rabi Oscillations: Population Dynamics')
@@ -106,27 +167,17 @@ def simulate_rabi_oscillations():
     
     # Add theoretical prediction
     rabi_freq = omega_rabi
-    P_excited_theory = np.sin(rabi_freq * t_points / 2)**2
+    P_excited_theory = np.sin(rabi_freq*t_points/2)**2
     ax1.plot(t_points, P_excited_theory, 'k--', alpha=0.7, 
              label=f'Theory: Ω = {omega_rabi}')
     ax1.legend()
     
     # Plot 2: Bloch sphere trajectory
-    b = qt.Bloch()
-    b.fig = fig
-    b.axes = ax2
+    b = qt.Bloch(fig=fig, axes=ax2)
     
     # Calculate Bloch vectors
     print("Calculating Bloch vectors...")
-    bloch_vectors = []
-    for state in tqdm(result.states, desc="Bloch vectors"):
-        bloch_vectors.append([
-            qt.expect(qt.sigmax(), state),
-            qt.expect(qt.sigmay(), state),
-            qt.expect(qt.sigmaz(), state)
-        ])
-    
-    bloch_vectors = np.array(bloch_vectors)
+    bloch_vectors = bloch_vectors_from_kets(psi)
     
     # Add trajectory to Bloch sphere
     b.add_points(bloch_vectors.T)
@@ -140,40 +191,37 @@ def simulate_rabi_oscillations():
     plt.suptitle('QuTiP Demo: Rabi Oscillations Visualization', fontsize=16, y=1.02)
     plt.show()
     
-    return result, t_points
+    return psi, t_points
 
 def demonstrate_quantum_gates():
     """Demonstrate various quantum gates and their effects on the Bloch sphere."""
     print("\n🚪 Demonstrating Quantum Gates...")
     
     # Create initial state: |+⟩ = (|0⟩ + |1⟩)/√2
-    initial_state = (qt.basis(2, 0) + qt.basis(2, 1)).unit()
+    initial_state = (_G + _E).unit()
     
     # Define quantum gates
     gates = {
-        'I (Identity)': qt.qeye(2),
-        'X (Pauli-X)': qt.sigmax(),
-        'Y (Pauli-Y)': qt.sigmay(),
-        'Z (Pauli-Z)': qt.sigmaz(),
-        'H (Hadamard)': (qt.sigmax() + qt.sigmaz()).unit(),
-        'S (Phase)': qt.qdiags([1, 1j], 0),
-        'T (π/8)': qt.qdiags([1, np.exp(1j*np.pi/4)], 0),
+        'I (Identity)': _I2,
+        'X (Pauli-X)': _SX,
+        'Y (Pauli-Y)': _SY,
+        'Z (Pauli-Z)': _SZ,
+        'H (Hadamard)': _H,
+        'S (Phase)': _S,
+        'T (π/8)': _T,
     }
     
+    # The initial state is shared by every panel
+    initial_bloch = bloch_vectors_from_kets(stack_kets([initial_state]))[0]
+    
+    # Apply every gate and get all final Bloch vectors in one batch
+    final_states = [gate * initial_state for gate in gates.values()]
+    final_bloch = bloch_vectors_from_kets(stack_kets(final_states))
+    
     # Create figure with subplots
     fig = plt.figure(figsize=(16, 12))
     
-    for i, (gate_name, gate) in enumerate(gates.items()):
-        # Apply gate
-        final_state = gate * initial_state
-        
-        # Calculate Bloch vector
-        bloch_vector = [
-            qt.expect(qt.sigmax(), final_state),
-            qt.expect(qt.sigmay(), final_state),
-            qt.expect(qt.sigmaz(), final_state)
-        ]
-        
+    for i, (gate_name, bloch_vector) in enumerate(zip(gates, final_bloch)):
         # Create subplot
         ax = fig.add_subplot(2, 4, i+1, projection='3d')
         
@@ -183,12 +231,6 @@ def demonstrate_quantum_gates():
         b.axes = ax
         
         # Add initial state (green) and final state (red)
-        initial_bloch = [
-            qt.expect(qt.sigmax(), initial_state),
-            qt.expect(qt.sigmay(), initial_state),
-            qt.expect(qt.sigmaz(), initial_state)
-        ]
-        
         b.add_vectors(initial_bloch, 'g')
         b.add_vectors(bloch_vector, 'r')
         b.render()
@@ -199,8 +241,13 @@ def demonstrate_quantum_gates():
                  fontsize=14, y=0.98)
     plt.show()
 
-def animated_bloch_evolution():
-    """Create an animated Bloch sphere showing time evolution."""
+def animated_bloch_evolution(use_numerical=False):
+    """
+    Create an animated Bloch sphere showing time evolution.
+    
+    Parameters:
+    use_numerical: integrate with sesolve instead of the closed-form propagator
+    """
     print("\n🎬 Creating Animated Bloch Sphere Evolution...")
     
     # Parameters for a more interesting evolution
@@ -208,11 +255,8 @@ def animated_bloch_evolution():
     omega_x = 0.3
     omega_y = 0.2
     
-    # Time-dependent Hamiltonian for interesting dynamics
-    H = omega_0/2 * qt.sigmaz() + omega_x/2 * qt.sigmax() + omega_y/2 * qt.sigmay()
-    
     # Initial state: superposition
-    psi0 = (qt.basis(2, 0) + 0.7*qt.basis(2, 1)).unit()
+    psi0 = (_G + 0.7*_E).unit()
     
     # Time points
     t_max = 10
@@ -220,46 +264,48 @@ def animated_bloch_evolution():
     
     # Solve evolution
     print("Solving for animated evolution...")
-    result = qt.mesolve(H, psi0, t_points, [], [])
+    if use_numerical:
+        H = omega_0/2 * _SZ + omega_x/2 * _SX + omega_y/2 * _SY
+        psi = stack_kets(qt.sesolve(H, psi0, t_points, options=_SOLVER_OPTS).states)
+    else:
+        psi = precession_kets((omega_x, omega_y, omega_0), psi0, t_points)
     
     # Calculate Bloch vectors
-    bloch_vectors = []
-    for state in result.states:
-        bloch_vectors.append([
-            qt.expect(qt.sigmax(), state),
-            qt.expect(qt.sigmay(), state),
-            qt.expect(qt.sigmaz(), state)
-        ])
+    bloch_vectors = bloch_vectors_from_kets(psi)
     
     # Create animation
     fig = plt.figure(figsize=(10, 8))
     ax = fig.add_subplot(111, projection='3d')
     
-    b = qt.Bloch()
-    b.fig = fig
-    b.axes = ax
+    # Draw the static sphere, axes and labels once; only the trajectory
+    # and the state vector change from frame to frame
+    b = qt.Bloch(fig=fig, axes=ax)
+    b.render()
+    ax.set_xlim3d([-1, 1])
+    ax.set_ylim3d([-1, 1])
+    ax.set_zlim3d([-1, 1])
+    
+    # qt.Bloch draws (x, y, z) at axes coordinates (y, -x, z)
+    xyz = np.column_stack([bloch_vectors[:, 1], -bloch_vectors[:, 0], bloch_vectors[:, 2]])
+    
+    traj_line, = ax.plot([], [], [], 'b.', ms=6)
+    state_arrow = [ax.quiver(0, 0, 0, *xyz[0], color='r', linewidth=3)]
+    title = ax.text2D(0.5, 0.95, '', transform=ax.transAxes, ha='center')
     
     def animate(frame):
-        b.clear()
-        # Add trajectory up to current frame
-        if frame > 0:
-            trajectory = np.array(bloch_vectors[:frame+1]).T
-            b.add_points(trajectory)
+        # Trajectory up to the current frame
+        traj_line.set_data_3d(xyz[:frame+1, 0], xyz[:frame+1, 1], xyz[:frame+1, 2])
         
-        # Add current state vector
-        b.add_vectors(bloch_vectors[frame], 'r')
-        b.render()
-        ax.set_title(f'Quantum State Evolution (t = {t_points[frame]:.2f})')
-        # Ensure 3D axis properties are set correctly
-        if hasattr(ax, 'set_xlim3d'):
-            ax.set_xlim3d([-1, 1])
-            ax.set_ylim3d([-1, 1])
-            ax.set_zlim3d([-1, 1])
-        return ax,
+        # Current state vector (3D quivers can't be updated in place)
+        state_arrow[0].remove()
+        state_arrow[0] = ax.quiver(0, 0, 0, *xyz[frame], color='r', linewidth=3)
+        
+        title.set_text(f'Quantum State Evolution (t = {t_points[frame]:.2f})')
+        return traj_line, state_arrow[0], title
     
     # Create animation
     anim = FuncAnimation(fig, animate, frames=len(t_points), 
-                        interval=100, blit=False, repeat=True)
+                        interval=100, blit=True, repeat=True)
     
     plt.show()
     
@@ -278,7 +324,7 @@ def main():
     
     # Demo 1: Rabi oscillations
     try:
-        result, t_points = simulate_rabi_oscillations()
+        psi, t_points = simulate_rabi_oscillations()
         print("✅ Rabi oscillations demo completed!")
     except Exception as e:
         print(f"❌ Error in Rabi oscillations demo: {e}")
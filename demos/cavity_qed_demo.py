@@ -13,10 +13,11 @@ Author: QuTiP Demo Project
 License: MIT
 """
 
+import functools
+import math
 import numpy as np
 import matplotlib.pyplot as plt
 import qutip as qt
-from tqdm import tqdm
 import warnings
 
 # Suppress numerical warnings for cleaner output
@@ -34,6 +35,49 @@ except OSError:
 plt.rcParams['figure.figsize'] = (14, 10)
 plt.rcParams['font.size'] = 12
 
+# Closed-system solves don't need QuTiP 5's per-step output renormalization.
+# Every solve here reports through e_ops, so intermediate states are dropped.
+_SOLVER_OPTS = {"normalize_output": False, "store_states": False}
+
+@functools.lru_cache(maxsize=8)
+def _jc_ops(N_cavity):
+    """
+    Build the Jaynes-Cummings operators for a given cavity truncation.
+    
+    The operator structure only depends on N_cavity, so it is built once
+    per size and shared by every simulation below. All operators are stored
+    as CSR so the Hamiltonians and observables built from them share one
+    data layout and the solvers never convert formats between steps.
+    
+    Returns (a, a_dag, n_c, sigma_z, sigma_plus, sigma_minus, sigma_pm,
+    n2_op, h_int)
+    """
+    # Cavity operators
+    a = qt.tensor(qt.destroy(N_cavity), qt.qeye(2))  # cavity annihilation
+    a_dag = a.dag()                                   # cavity creation
+    n_c = a_dag * a                                   # cavity number operator
+    n2_op = a_dag * a_dag * a * a                     # a†a†aa
+    
+    # Atomic operators in the (|g⟩, |e⟩) = (basis(2, 0), basis(2, 1)) ordering
+    # used throughout this module. QuTiP's sigmap/sigmaz treat basis(2, 0) as
+    # the upper level, so they are mirrored here.
+    sigma_z = qt.tensor(qt.qeye(N_cavity), -qt.sigmaz())   # atomic inversion
+    sigma_plus = qt.tensor(qt.qeye(N_cavity), qt.sigmam()) # atomic raising |e⟩⟨g|
+    sigma_minus = qt.tensor(qt.qeye(N_cavity), qt.sigmap()) # atomic lowering |g⟩⟨e|
+    sigma_pm = sigma_plus * sigma_minus                     # excited-state projector
+    
+    # Atom-cavity exchange term (a†σ- + aσ+)
+    h_int = a_dag * sigma_minus + a * sigma_plus
+    
+    return tuple(op.to("csr") for op in
+                 (a, a_dag, n_c, sigma_z, sigma_plus, sigma_minus, sigma_pm,
+                  n2_op, h_int))
+
+@functools.lru_cache(maxsize=256)
+def _fock_proj(N_cavity, n):
+    """Projector |n⟩⟨n| ⊗ I onto n cavity photons, cached per (N_cavity, n)."""
+    return qt.tensor(qt.basis(N_cavity, n).proj(), qt.qeye(2)).to("csr")
+
 def jaynes_cummings_hamiltonian(omega_c, omega_a, g, N_cavity=10):
     """
     Create the Jaynes-Cummings Hamiltonian for atom-cavity interaction.
@@ -46,25 +90,30 @@ def jaynes_cummings_hamiltonian(omega_c, omega_a, g, N_cavity=10):
     
     Returns Hamiltonian in the basis |n,ground⟩, |n,excited⟩
     """
-    # Create operators
-    # Cavity operators
-    a = qt.tensor(qt.destroy(N_cavity), qt.qeye(2))  # cavity annihilation
-    a_dag = a.dag()                                   # cavity creation
-    n_c = a_dag * a                                   # cavity number operator
-    
-    # Atomic operators  
-    sigma_z = qt.tensor(qt.qeye(N_cavity), qt.sigmaz())    # atomic inversion
-    sigma_plus = qt.tensor(qt.qeye(N_cavity), qt.sigmap()) # atomic raising
-    sigma_minus = qt.tensor(qt.qeye(N_cavity), qt.sigmam()) # atomic lowering
+    # Cached cavity and atomic operators
+    a, a_dag, n_c, sigma_z, sigma_plus, sigma_minus, _, _, h_int = _jc_ops(N_cavity)
     
     # Jaynes-Cummings Hamiltonian
     # H = ωc a†a + ωa/2 σz + g(a†σ- + aσ+)
-    H = omega_c * n_c + omega_a/2 * sigma_z + g * (a_dag * sigma_minus + a * sigma_plus)
+    # Only the scalar coefficients change between calls, so this is a cheap
+    # linear combination of the cached operators
+    H = omega_c * n_c + omega_a/2 * sigma_z + g * h_int
     
     return H, a, a_dag, sigma_plus, sigma_minus, sigma_z
 
-def vacuum_rabi_oscillations():
-    """Demonstrate vacuum Rabi oscillations in the Jaynes-Cummings model."""
+def vacuum_rabi_oscillations(use_numerical=False, psi0=None):
+    """
+    Demonstrate vacuum Rabi oscillations in the Jaynes-Cummings model.
+    
+    On resonance, |0,e⟩ only couples to |1,g⟩ and the state stays
+    cos(gt)|0,e⟩ - i sin(gt)|1,g⟩, so the observables are evaluated in
+    closed form. The full 2N-dimensional solve is used off resonance, for
+    other initial states, or when use_numerical is set.
+    
+    Parameters:
+    use_numerical: always integrate with sesolve
+    psi0: initial ket on the cavity ⊗ atom space (default |0,e⟩)
+    """
     print("🔄 Simulating Vacuum Rabi Oscillations...")
     
     # Parameters
@@ -77,41 +126,55 @@ def vacuum_rabi_oscillations():
     t_max = 40
     t_points = np.linspace(0, t_max, 300)
     
+    # Initial state: atom excited, cavity vacuum |0,e⟩ unless one is given;
+    # only that default has the closed form below
+    closed_form = psi0 is None and not use_numerical and math.isclose(omega_c, omega_a)
+    if psi0 is None:
+        psi0 = qt.tensor(qt.basis(N_cavity, 0), qt.basis(2, 1))
+    
+    max_n = min(5, N_cavity)  # Show first 5 Fock states
+    snapshot_idxs = [0, len(t_points)//4, len(t_points)//2, 3*len(t_points)//4]
+    
+    if closed_form:
+        # Closed-form dynamics in the {|0,e⟩, |1,g⟩} doublet
+        print("Evaluating vacuum Rabi doublet in closed form...")
+        result = None
+        P_excited = np.cos(g*t_points)**2
+        P_ground = 1 - P_excited
+        n_photons = P_ground  # each lost atomic excitation is one photon
+        
+        # Only |0⟩ and |1⟩ are ever populated
+        photon_dist = []
+        for idx in snapshot_idxs:
+            probs = np.zeros(max_n)
+            probs[:2] = P_excited[idx], n_photons[idx]
+            photon_dist.append(probs)
+        
+        return t_points, P_excited, P_ground, n_photons, photon_dist, result
+    
     # Create Hamiltonian and operators
     H, a, a_dag, sigma_plus, sigma_minus, sigma_z = jaynes_cummings_hamiltonian(
         omega_c, omega_a, g, N_cavity)
     
-    # Initial state: atom excited, cavity vacuum |0,e⟩
-    psi0 = qt.tensor(qt.basis(N_cavity, 0), qt.basis(2, 1))
+    # Observables evaluated by the solver: atomic excitation, photon number
+    # and the Fock-state populations for the photon-number snapshots
+    _, _, n_c, _, _, _, sigma_pm, _, _ = _jc_ops(N_cavity)
+    fock_ops = [_fock_proj(N_cavity, n) for n in range(max_n)]
+    e_ops = [sigma_pm, n_c] + fock_ops
     
     # Solve the Schrödinger equation
     print("Solving Jaynes-Cummings dynamics...")
-    result = qt.mesolve(H, psi0, t_points, [], [])
+    result = qt.sesolve(H, psi0, t_points, e_ops=e_ops, options=_SOLVER_OPTS)
     
     # Calculate observables
     print("Calculating observables...")
-    P_excited = []  # Atomic excited state population
-    P_ground = []   # Atomic ground state population
-    n_photons = []  # Average photon number
-    photon_dist = []  # Photon number distribution
-    
-    for state in tqdm(result.states, desc="Processing states"):
-        # Atomic populations
-        P_excited.append(qt.expect(sigma_plus * sigma_minus, state))
-        P_ground.append(1 - P_excited[-1])
-        
-        # Cavity photon number
-        n_photons.append(qt.expect(a_dag * a, state))
-        
-        # Photon number distribution for selected times
-        if len(photon_dist) < 4 and len(P_excited) % (len(t_points)//4) == 0:
-            # Calculate probability of each photon number
-            probs = []
-            for n in range(min(5, N_cavity)):  # Show first 5 Fock states
-                proj_n = qt.tensor(qt.basis(N_cavity, n) * qt.basis(N_cavity, n).dag(), 
-                                 qt.qeye(2))
-                probs.append(qt.expect(proj_n, state))
-            photon_dist.append(probs)
+    P_excited = result.expect[0]  # Atomic excited state population
+    P_ground = 1 - P_excited      # Atomic ground state population
+    n_photons = result.expect[1]  # Average photon number
+    
+    # Photon number distribution for selected times
+    fock_pops = np.array(result.expect[2:])
+    photon_dist = [fock_pops[:, idx] for idx in snapshot_idxs]
     
     return t_points, P_excited, P_ground, n_photons, photon_dist, result
 
@@ -129,7 +192,7 @@ def plot_vacuum_rabi():
     
     # Add theoretical vacuum Rabi frequency
     g = 0.1
-    theory = 0.5 * (1 + np.cos(2*g*t_points))
+    theory = 0.5*(1 + np.cos(2*g*t_points))
     plt.plot(t_points, theory, 'k--', alpha=0.7, label='Theory')
     
     plt.xlabel('Time (1/ωc)')
@@ -143,7 +206,7 @@ def plot_vacuum_rabi():
     plt.plot(t_points, n_photons, 'g-', linewidth=2, label='<n>')
     
     # Theoretical photon number
-    n_theory = 0.5 * (1 - np.cos(2*g*t_points))
+    n_theory = 0.5*(1 - np.cos(2*g*t_points))
     plt.plot(t_points, n_theory, 'k--', alpha=0.7, label='Theory')
     
     plt.xlabel('Time (1/ωc)')
@@ -156,7 +219,7 @@ def plot_vacuum_rabi():
     ax3 = plt.subplot(2, 3, 3)
     plt.plot(t_points, P_excited, 'r-', linewidth=2, label='Atomic Energy')
     plt.plot(t_points, n_photons, 'g-', linewidth=2, label='Cavity Energy')
-    total_energy = np.array(P_excited) + np.array(n_photons)
+    total_energy = P_excited + n_photons
     plt.plot(t_points, total_energy, 'k-', linewidth=2, label='Total Energy')
     plt.xlabel('Time (1/ωc)')
     plt.ylabel('Energy (hbar*w units)')
@@ -181,8 +244,15 @@ def plot_vacuum_rabi():
                  fontsize=16, y=0.98)
     plt.show()
 
-def thermal_state_evolution():
-    """Demonstrate evolution starting from thermal cavity state."""
+def thermal_state_evolution(use_numerical=False):
+    """
+    Demonstrate evolution starting from thermal cavity state.
+    
+    There is no dissipation, so ρ(t) = U(t) ρ₀ U(t)† with U(t) = exp(-iHt).
+    H is diagonalised once; in its eigenbasis each element of ρ only picks
+    up a phase, and the observables follow without building the N²×N²
+    Liouvillian. use_numerical switches back to mesolve.
+    """
     print("🌡️  Simulating Thermal State Evolution...")
     
     # Parameters
@@ -207,24 +277,37 @@ def thermal_state_evolution():
     # Initial state: thermal cavity + ground atom
     rho0 = qt.tensor(cavity_thermal, atom_ground)
     
-    # Solve master equation
-    print("Solving thermal state evolution...")
-    result = qt.mesolve(H, rho0, t_points, [], [])
+    _, _, n_c, _, _, _, sigma_pm, n2_op, _ = _jc_ops(N_cavity)
+    e_ops = [sigma_pm, n_c, n2_op]
     
-    # Calculate observables
-    P_excited = []
-    n_photons = []
-    photon_variance = []
-    
-    for state in tqdm(result.states, desc="Calculating observables"):
-        P_excited.append(qt.expect(sigma_plus * sigma_minus, state))
-        n_avg = qt.expect(a_dag * a, state)
-        n_photons.append(n_avg)
-        n_squared = qt.expect(a_dag * a_dag * a * a, state)
-        photon_variance.append(n_squared - n_avg**2)
+    if use_numerical:
+        # Solve master equation
+        print("Solving thermal state evolution...")
+        result = qt.mesolve(H, rho0, t_points, e_ops=e_ops,
+                            options={"store_states": False})
+        P_excited, n_photons, n_squared = result.expect
+    else:
+        print("Evolving thermal state in the energy eigenbasis...")
+        energies, V = np.linalg.eigh(H.full())
+        rho_e = V.conj().T @ rho0.full() @ V
+        # ρ_ij(t) = ρ_ij(0) exp(-i(E_i - E_j)t)
+        phases = np.exp(-1j * np.subtract.outer(energies, energies)[..., None] * t_points)
+        # <O>(t) = Σ_ij ρ_ij(t) O_ji
+        ops_e = np.stack([V.conj().T @ op.full() @ V for op in e_ops])
+        P_excited, n_photons, n_squared = np.einsum(
+            'ij,oji,ijt->ot', rho_e, ops_e, phases, optimize=True).real
+    photon_variance = n_squared - n_photons**2
     
     return t_points, P_excited, n_photons, photon_variance
 
+def _strong_coupling_run(g, omega_c, omega_a, N_cavity, t_points):
+    """Excited-state population from |0,e⟩ for one coupling strength."""
+    H = jaynes_cummings_hamiltonian(omega_c, omega_a, g, N_cavity)[0]
+    psi0 = qt.tensor(qt.basis(N_cavity, 0), qt.basis(2, 1))
+    sigma_pm = _jc_ops(N_cavity)[6]  # excited-state projector
+    result = qt.sesolve(H, psi0, t_points, e_ops=[sigma_pm], options=_SOLVER_OPTS)
+    return result.expect[0]
+
 def strong_coupling_regime():
     """Demonstrate strong coupling effects with varying coupling strength."""
     print("💪 Exploring Strong Coupling Regime...")
@@ -241,31 +324,24 @@ def strong_coupling_regime():
     t_max = 25
     t_points = np.linspace(0, t_max, 200)
     
+    # The runs are independent, but each 16-dimensional solve takes a few
+    # milliseconds, less than starting a parallel_map worker, so they run
+    # serially; parallel_map takes the same arguments for bigger cavities
+    print(f"Simulating g = {', '.join(map(str, g_values))}...")
+    populations = qt.serial_map(_strong_coupling_run, g_values,
+                                task_args=(omega_c, omega_a, N_cavity, t_points),
+                                progress_bar="tqdm")
+    
     fig, axes = plt.subplots(2, 2, figsize=(12, 10))
     axes = axes.ravel()
     
-    for i, g in enumerate(g_values):
-        print(f"Simulating g = {g}...")
-        
-        # Create Hamiltonian
-        H, a, a_dag, sigma_plus, sigma_minus, sigma_z = jaynes_cummings_hamiltonian(
-            omega_c, omega_a, g, N_cavity)
-        
-        # Initial state: atom excited, cavity vacuum
-        psi0 = qt.tensor(qt.basis(N_cavity, 0), qt.basis(2, 1))
-        
-        # Solve
-        result = qt.mesolve(H, psi0, t_points, [], [])
-        
-        # Calculate atomic excited state population
-        P_excited = [qt.expect(sigma_plus * sigma_minus, state) for state in result.states]
-        
+    for i, (g, P_excited) in enumerate(zip(g_values, populations)):
         # Plot
         axes[i].plot(t_points, P_excited, 'r-', linewidth=2, label=f'g = {g}')
         
         # Add theoretical Rabi frequency
         rabi_freq = 2*g  # Vacuum Rabi frequency
-        theory = 0.5 * (1 + np.cos(rabi_freq * t_points))
+        theory = 0.5*(1 + np.cos(rabi_freq*t_points))
         axes[i].plot(t_points, theory, 'k--', alpha=0.7, label='Theory')
         
         axes[i].set_xlabel('Time (1/ωc)')
@@ -279,6 +355,26 @@ def strong_coupling_regime():
                  fontsize=14, y=0.98)
     plt.show()
 
+def _cavity_decay_run(kappa, omega_c, omega_a, g, N_cavity, t_points):
+    """Excited-state population and photon number from |0,e⟩ for one decay rate."""
+    H, a = jaynes_cummings_hamiltonian(omega_c, omega_a, g, N_cavity)[:2]
+    psi0 = qt.tensor(qt.basis(N_cavity, 0), qt.basis(2, 1))  # atom excited, cavity vacuum
+    _, _, n_c, _, _, _, sigma_pm, _, _ = _jc_ops(N_cavity)
+    e_ops = [sigma_pm, n_c]
+    
+    if kappa > 0:
+        # Collapse operators for cavity decay
+        c_ops = [math.sqrt(kappa) * a]  # Cavity photon loss
+        
+        # Solve master equation
+        result = qt.mesolve(H, psi0, t_points, c_ops, e_ops=e_ops,
+                            options={"matrix_form": True, "store_states": False})
+    else:
+        # No decay: the evolution stays pure, so solve in Hilbert space
+        result = qt.sesolve(H, psi0, t_points, e_ops=e_ops, options=_SOLVER_OPTS)
+    
+    return tuple(result.expect)
+
 def cavity_decay_effects():
     """Demonstrate effects of cavity decay on dynamics."""
     print("📉 Simulating Cavity Decay Effects...")
@@ -294,31 +390,17 @@ def cavity_decay_effects():
     t_max = 40
     t_points = np.linspace(0, t_max, 200)
     
+    # Serial for the same reason as strong_coupling_regime: each 20-dimensional
+    # solve is cheaper than starting a parallel_map worker
+    print(f"Simulating κ = {', '.join(map(str, kappa_values))}...")
+    observables = qt.serial_map(_cavity_decay_run, kappa_values,
+                                task_args=(omega_c, omega_a, g, N_cavity, t_points),
+                                progress_bar="tqdm")
+    
     fig, axes = plt.subplots(2, 2, figsize=(12, 10))
     axes = axes.ravel()
     
-    for i, kappa in enumerate(kappa_values):
-        print(f"Simulating κ = {kappa}...")
-        
-        # Create Hamiltonian
-        H, a, a_dag, sigma_plus, sigma_minus, sigma_z = jaynes_cummings_hamiltonian(
-            omega_c, omega_a, g, N_cavity)
-        
-        # Initial state: atom excited, cavity vacuum
-        psi0 = qt.tensor(qt.basis(N_cavity, 0), qt.basis(2, 1))
-        
-        # Collapse operators for cavity decay
-        c_ops = []
-        if kappa > 0:
-            c_ops.append(np.sqrt(kappa) * a)  # Cavity photon loss
-        
-        # Solve master equation
-        result = qt.mesolve(H, psi0, t_points, c_ops, [])
-        
-        # Calculate observables
-        P_excited = [qt.expect(sigma_plus * sigma_minus, state) for state in result.states]
-        n_photons = [qt.expect(a_dag * a, state) for state in result.states]
-        
+    for i, (kappa, (P_excited, n_photons)) in enumerate(zip(kappa_values, observables)):
         # Plot atomic population
         axes[i].plot(t_points, P_excited, 'r-', linewidth=2, label='Excited |e>')
         axes[i].plot(t_points, n_photons, 'g-', linewidth=2, label='<n>')
@@ -363,19 +445,21 @@ def photon_statistics():
         
         # Calculate photon number distribution
         try:
+            n_max = min(10, N_cavity)
             if state.type == 'ket':
-                probs = [float(abs(state[n])**2) for n in range(min(10, N_cavity))]
+                probs = np.abs(state.full().ravel()[:n_max])**2
             else:  # density matrix
-                probs = [float(state[n,n].real) for n in range(min(10, N_cavity))]
+                probs = state.full().diagonal()[:n_max].real.copy()
             
             # Normalize probabilities to avoid numerical errors
-            prob_sum = sum(probs)
+            prob_sum = probs.sum()
             if prob_sum > 0:
-                probs = [p/prob_sum for p in probs]
+                probs = probs / prob_sum
             
             # Calculate statistics
-            n_avg = sum(n * p for n, p in enumerate(probs))
-            n_squared = sum(n**2 * p for n, p in enumerate(probs))
+            n = np.arange(len(probs))
+            n_avg = n @ probs
+            n_squared = (n**2) @ probs
             variance = max(0, n_squared - n_avg**2)  # Ensure non-negative
             
             # Mandel Q parameter
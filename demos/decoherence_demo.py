@@ -12,10 +12,11 @@ Author: QuTiP Demo Project
 License: MIT
 """
 
+import functools
+import math
 import numpy as np
 import matplotlib.pyplot as plt
 import qutip as qt
-from tqdm import tqdm
 import warnings
 
 # Suppress numerical warnings for cleaner output
@@ -33,6 +34,58 @@ except OSError:
 plt.rcParams['figure.figsize'] = (14, 10)
 plt.rcParams['font.size'] = 12
 
+# Constant single-qubit operators, built once at import time and shared by
+# every simulation below. This module labels |0⟩ = basis(2, 0) ground and
+# |1⟩ = basis(2, 1) excited; QuTiP's sigmam() maps |0⟩ → |1⟩, so the
+# ladder operators are written out as projectors with the matching sense.
+_SX, _SY, _SZ = qt.sigmax(), qt.sigmay(), qt.sigmaz()
+_SM = qt.projection(2, 0, 1)   # lowering |1⟩ → |0⟩
+_SP = qt.projection(2, 1, 0)   # raising |0⟩ → |1⟩
+_P11 = qt.projection(2, 1, 1)  # excited-state projector
+
+_COLLAPSE_BASE = {'sigmam': _SM, 'sigmap': _SP, 'sigmax': _SX, 'sigmay': _SY, 'sigmaz': _SZ}
+
+@functools.lru_cache(maxsize=None)
+def _collapse_op(name, rate):
+    """
+    Collapse operator √rate · op for a named single-qubit operator.
+    
+    Qobj is unhashable, so operators are keyed by name; each (name, rate)
+    pair is scaled once and shared by every simulation that uses it.
+    """
+    return math.sqrt(rate) * _COLLAPSE_BASE[name]
+
+# Plot-quality tolerances; progress is reported with one message per solve
+# rather than a per-step bar
+_SOLVER_OPTS = {"atol": 1e-6, "rtol": 1e-4, "nsteps": 5000, "progress_bar": False}
+
+def density_observables(states):
+    """
+    Populations, Bloch vector and coherence along a single-qubit trajectory.
+    
+    For a 2x2 density matrix each of these is a matrix element, so they are
+    read off the stacked trajectory in one NumPy pass instead of one
+    qt.expect call per observable and time step.
+    
+    Parameters:
+    states: list of single-qubit density matrices
+    
+    Returns a dict of arrays keyed 'P_ground', 'P_excited', 'bloch_x',
+    'bloch_y', 'bloch_z' and 'coherence'.
+    """
+    rho = np.stack([state.full() for state in states])
+    P_ground = rho[:, 0, 0].real
+    P_excited = rho[:, 1, 1].real
+    rho_10 = rho[:, 1, 0]
+    return {
+        'P_ground': P_ground,
+        'P_excited': P_excited,
+        'bloch_x': 2 * rho_10.real,          # ρ₀₁ + ρ₁₀
+        'bloch_y': 2 * rho_10.imag,          # i(ρ₀₁ - ρ₁₀)
+        'bloch_z': P_ground - P_excited,
+        'coherence': np.abs(rho_10),
+    }
+
 def create_superposition_state(theta=np.pi/4, phi=0):
     """
     Create a superposition state on the Bloch sphere.
@@ -59,30 +112,22 @@ def simulate_t1_relaxation():
     psi0 = qt.basis(2, 1)
     
     # Hamiltonian (free evolution)
-    H = omega_0/2 * qt.sigmaz()
+    H = omega_0/2 * _SZ
     
     # Collapse operators for T1 relaxation
-    c_ops = [np.sqrt(gamma) * qt.sigmam()]  # |1⟩ → |0⟩ transition
+    c_ops = [_collapse_op('sigmam', gamma)]  # |1⟩ → |0⟩ transition
     
     # Solve master equation
     print("Solving master equation for T1 relaxation...")
-    result = qt.mesolve(H, psi0, t_points, c_ops, [])
+    L = qt.liouvillian(H, c_ops)
+    result = qt.mesolve(L, psi0, t_points, options=_SOLVER_OPTS)
+    print(f"Solved {len(t_points)} time steps.")
     
     # Calculate populations and coherences
-    P_ground = []
-    P_excited = []
-    coherence = []
-    
-    for state in tqdm(result.states, desc="Calculating observables"):
-        # Populations
-        P_ground.append(qt.expect(qt.projection(2, 0, 0), state))
-        P_excited.append(qt.expect(qt.projection(2, 1, 1), state))
-        
-        # Coherence (off-diagonal elements)
-        rho = state
-        if rho.type == 'ket':
-            rho = qt.ket2dm(rho)
-        coherence.append(abs(rho[0, 1]))
+    observables = density_observables(result.states)
+    P_ground = observables['P_ground']
+    P_excited = observables['P_excited']
+    coherence = observables['coherence']
     
     return t_points, P_ground, P_excited, coherence, result
 
@@ -102,38 +147,22 @@ def simulate_t2_dephasing():
     psi0 = create_superposition_state(np.pi/2, 0)
     
     # Hamiltonian
-    H = omega_0/2 * qt.sigmaz()
+    H = omega_0/2 * _SZ
     
     # Collapse operators for pure dephasing
-    c_ops = [np.sqrt(gamma_phi) * qt.sigmaz()]
+    c_ops = [_collapse_op('sigmaz', gamma_phi)]
     
     # Solve master equation
     print("Solving master equation for T2 dephasing...")
-    result = qt.mesolve(H, psi0, t_points, c_ops, [])
+    L = qt.liouvillian(H, c_ops)
+    result = qt.mesolve(L, psi0, t_points, options=_SOLVER_OPTS)
+    print(f"Solved {len(t_points)} time steps.")
     
     # Calculate observables
-    P_ground = []
-    P_excited = []
-    coherence = []
-    bloch_x = []
-    bloch_y = []
-    bloch_z = []
-    
-    for state in tqdm(result.states, desc="Calculating observables"):
-        # Populations
-        P_ground.append(qt.expect(qt.projection(2, 0, 0), state))
-        P_excited.append(qt.expect(qt.projection(2, 1, 1), state))
-        
-        # Bloch vector components
-        bloch_x.append(qt.expect(qt.sigmax(), state))
-        bloch_y.append(qt.expect(qt.sigmay(), state))
-        bloch_z.append(qt.expect(qt.sigmaz(), state))
-        
-        # Coherence
-        rho = state
-        if rho.type == 'ket':
-            rho = qt.ket2dm(rho)
-        coherence.append(abs(rho[0, 1]))
+    observables = density_observables(result.states)
+    P_ground, P_excited, bloch_x, bloch_y, bloch_z, coherence = (
+        observables[name] for name in
+        ('P_ground', 'P_excited', 'bloch_x', 'bloch_y', 'bloch_z', 'coherence'))
     
     return t_points, P_ground, P_excited, coherence, bloch_x, bloch_y, bloch_z, result
 
@@ -157,43 +186,22 @@ def simulate_t1_and_t2():
     psi0 = create_superposition_state(np.pi/3, np.pi/4)
     
     # Hamiltonian
-    H = omega_0/2 * qt.sigmaz()
+    H = omega_0/2 * _SZ
     
     # Collapse operators
     c_ops = [
-        np.sqrt(gamma) * qt.sigmam(),      # T1 relaxation
-        np.sqrt(gamma_phi) * qt.sigmaz()   # Pure dephasing
+        _collapse_op('sigmam', gamma),      # T1 relaxation
+        _collapse_op('sigmaz', gamma_phi)   # Pure dephasing
     ]
     
     # Solve master equation
     print("Solving master equation for combined effects...")
-    result = qt.mesolve(H, psi0, t_points, c_ops, [])
+    L = qt.liouvillian(H, c_ops)
+    result = qt.mesolve(L, psi0, t_points, options=_SOLVER_OPTS)
+    print(f"Solved {len(t_points)} time steps.")
     
     # Calculate observables
-    observables = {
-        'P_ground': [],
-        'P_excited': [],
-        'coherence': [],
-        'bloch_x': [],
-        'bloch_y': [],
-        'bloch_z': []
-    }
-    
-    for state in tqdm(result.states, desc="Calculating observables"):
-        # Populations
-        observables['P_ground'].append(qt.expect(qt.projection(2, 0, 0), state))
-        observables['P_excited'].append(qt.expect(qt.projection(2, 1, 1), state))
-        
-        # Bloch vector
-        observables['bloch_x'].append(qt.expect(qt.sigmax(), state))
-        observables['bloch_y'].append(qt.expect(qt.sigmay(), state))
-        observables['bloch_z'].append(qt.expect(qt.sigmaz(), state))
-        
-        # Coherence
-        rho = state
-        if rho.type == 'ket':
-            rho = qt.ket2dm(rho)
-        observables['coherence'].append(abs(rho[0, 1]))
+    observables = density_observables(result.states)
     
     return t_points, observables, result
 
@@ -214,24 +222,21 @@ def compare_closed_vs_open():
     psi0 = qt.basis(2, 0)  # Ground state
     
     # Hamiltonian (Rabi oscillations)
-    H = omega_0/2 * qt.sigmaz() + omega_rabi/2 * qt.sigmax()
+    H = omega_0/2 * _SZ + omega_rabi/2 * _SX
     
     # Closed system evolution
     print("Solving closed system...")
-    result_closed = qt.mesolve(H, psi0, t_points, [], [])
+    result_closed = qt.sesolve(H, psi0, t_points, e_ops=[_P11], options=_SOLVER_OPTS)
     
     # Open system evolution
     print("Solving open system...")
-    c_ops = [np.sqrt(gamma) * qt.sigmam()]
-    result_open = qt.mesolve(H, psi0, t_points, c_ops, [])
-    
-    # Calculate populations for both systems
-    P_excited_closed = []
-    P_excited_open = []
+    c_ops = [_collapse_op('sigmam', gamma)]
+    L = qt.liouvillian(H, c_ops)
+    result_open = qt.mesolve(L, psi0, t_points, options=_SOLVER_OPTS)
     
-    for state_c, state_o in zip(result_closed.states, result_open.states):
-        P_excited_closed.append(qt.expect(qt.projection(2, 1, 1), state_c))
-        P_excited_open.append(qt.expect(qt.projection(2, 1, 1), state_o))
+    # Excited-state populations for both systems
+    P_excited_closed = result_closed.expect[0]
+    P_excited_open = density_observables(result_open.states)['P_excited']
     
     return t_points, P_excited_closed, P_excited_open
 
@@ -316,22 +321,21 @@ def plot_decoherence_results():
     # Plot 6: Bloch sphere trajectory for combined effects
     ax6 = plt.subplot(2, 3, 6, projection='3d')
     
-    # Create Bloch sphere
-    b = qt.Bloch()
-    b.fig = fig
-    b.axes = ax6
+    # Only the trajectory is needed here, so a light wireframe sphere replaces
+    # the full qt.Bloch render
+    u, v = np.mgrid[0:2*np.pi:20j, 0:np.pi:10j]
+    ax6.plot_wireframe(np.cos(u)*np.sin(v), np.sin(u)*np.sin(v), np.cos(v),
+                       color='gray', alpha=0.2, linewidth=0.5)
     
     # Add trajectory
-    bloch_trajectory = np.array([
-        observables['bloch_x'],
-        observables['bloch_y'], 
-        observables['bloch_z']
-    ])
-    
-    b.add_points(bloch_trajectory)
-    b.add_vectors(bloch_trajectory[:, 0], 'g')  # Initial state
-    b.add_vectors(bloch_trajectory[:, -1], 'r')  # Final state
-    b.render()
+    bx, by, bz = observables['bloch_x'], observables['bloch_y'], observables['bloch_z']
+    ax6.plot(bx, by, bz, 'b-', linewidth=1.5)
+    ax6.scatter([bx[0]], [by[0]], [bz[0]], c='g', s=40)    # Initial state
+    ax6.scatter([bx[-1]], [by[-1]], [bz[-1]], c='r', s=40)  # Final state
+    ax6.set_xlabel('x')
+    ax6.set_ylabel('y')
+    ax6.set_zlabel('z')
+    ax6.set_box_aspect((1, 1, 1))
     ax6.set_title('Decoherence Trajectory\n(Green: Initial, Red: Final)')
     
     plt.tight_layout()
@@ -339,6 +343,12 @@ def plot_decoherence_results():
                  fontsize=16, y=0.98)
     plt.show()
 
+def _environment_run(L, psi0, t_points):
+    """Bloch vector components for one environment's Liouvillian."""
+    result = qt.mesolve(L, psi0, t_points, options=_SOLVER_OPTS)
+    observables = density_observables(result.states)
+    return observables['bloch_x'], observables['bloch_y'], observables['bloch_z']
+
 def demonstrate_different_environments():
     """Show how different environments affect quantum systems differently."""
     print("🌍 Demonstrating Different Environmental Effects...")
@@ -352,34 +362,35 @@ def demonstrate_different_environments():
     psi0 = create_superposition_state(np.pi/2, 0)
     
     # Hamiltonian
-    H = omega_0/2 * qt.sigmaz()
+    H = omega_0/2 * _SZ
     
     # Different environments
     environments = {
         'No Environment': [],
-        'Amplitude Damping': [np.sqrt(0.1) * qt.sigmam()],
-        'Phase Damping': [np.sqrt(0.1) * qt.sigmaz()],
-        'Depolarizing': [np.sqrt(0.05) * qt.sigmax(), 
-                        np.sqrt(0.05) * qt.sigmay(), 
-                        np.sqrt(0.05) * qt.sigmaz()],
-        'Hot Environment': [np.sqrt(0.1) * qt.sigmam(), 
-                           np.sqrt(0.02) * qt.sigmap()]  # Thermal excitation
+        'Amplitude Damping': [_collapse_op('sigmam', 0.1)],
+        'Phase Damping': [_collapse_op('sigmaz', 0.1)],
+        'Depolarizing': [_collapse_op('sigmax', 0.05), 
+                        _collapse_op('sigmay', 0.05), 
+                        _collapse_op('sigmaz', 0.05)],
+        'Hot Environment': [_collapse_op('sigmam', 0.1), 
+                           _collapse_op('sigmap', 0.02)]  # Thermal excitation
     }
     
+    # The environments are independent, but each is a 2x2 Liouvillian solve
+    # that finishes well before a parallel_map worker would even start, so
+    # they run serially; parallel_map takes the same arguments for bigger runs
+    print(f"Simulating {', '.join(environments)}...")
+    liouvillians = [qt.liouvillian(H, c_ops) for c_ops in environments.values()]
+    trajectories = qt.serial_map(_environment_run, liouvillians,
+                                 task_args=(psi0, t_points))
+    
     fig, axes = plt.subplots(2, 3, figsize=(15, 10))
     axes = axes.ravel()
     
-    for i, (env_name, c_ops) in enumerate(environments.items()):
+    for i, (env_name, (bloch_x, bloch_y, bloch_z)) in enumerate(
+            zip(environments, trajectories)):
         if i >= len(axes):
             break
-            
-        print(f"Simulating {env_name}...")
-        result = qt.mesolve(H, psi0, t_points, c_ops, [])
-        
-        # Calculate Bloch vector components
-        bloch_x = [qt.expect(qt.sigmax(), state) for state in result.states]
-        bloch_y = [qt.expect(qt.sigmay(), state) for state in result.states]
-        bloch_z = [qt.expect(qt.sigmaz(), state) for state in result.states]
         
         # Plot trajectory
         axes[i].plot(t_points, bloch_x, 'r-', label='<sigma_x>')
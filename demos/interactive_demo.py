@@ -15,9 +15,12 @@ Author: QuTiP Demo Project
 License: MIT
 """
 
+import functools
 import numpy as np
 import matplotlib.pyplot as plt
+from matplotlib.transforms import Bbox
 from matplotlib.widgets import Slider, Button, RadioButtons
+from scipy.linalg import expm
 import qutip as qt
 import warnings
 warnings.filterwarnings('ignore')
@@ -26,6 +29,209 @@ warnings.filterwarnings('ignore')
 plt.rcParams['figure.figsize'] = (14, 10)
 plt.rcParams['font.size'] = 11
 
+# Constant single-qubit operators and basis states, built once at import time
+# so the plot callbacks don't reconstruct a Qobj on every slider tick. |0⟩ =
+# basis(2, 0) is ground and |1⟩ = basis(2, 1) excited; QuTiP's sigmam() maps
+# |0⟩ → |1⟩, so the lowering operator is written out as a projector.
+_SX, _SY, _SZ = qt.sigmax(), qt.sigmay(), qt.sigmaz()
+_SM = qt.projection(2, 0, 1)   # lowering |1⟩ → |0⟩
+_G, _E = qt.basis(2, 0), qt.basis(2, 1)
+_PLUS = (_G + _E).unit()
+
+# Skip QuTiP 5's per-step output renormalization and the solver progress bar;
+# the callbacks rerun on every slider tick and neither is needed for plots
+_SOLVER_OPTS = {"normalize_output": False, "progress_bar": False}
+
+# Points on the plotted time axis, and the solver sampling used to fill it:
+# enough points per exchange period for linear interpolation to be exact to
+# the line width, bounded so slow dynamics still get a smooth curve
+_DISPLAY_POINTS = 200
+_SAMPLES_PER_PERIOD = 24
+_MIN_SOLVER_POINTS = 60
+
+def _photon_distributions(states, N_cavity):
+    """
+    Photon-number distributions of cavity ⊗ atom states, shape (T, N_cavity).
+    
+    The states are stacked into one array and the atom is traced out by
+    reshaping the (cavity, atom) index into two axes, so no Fock-state
+    projectors have to be built. The complex data is split into separate
+    real and imaginary float arrays up front, so the arithmetic runs on
+    contiguous float64 buffers instead of interleaved complex pairs.
+    """
+    data = np.stack([state.full() for state in states])
+    if states[0].type == 'ket':
+        shape = (len(states), N_cavity, 2)
+        real = np.ascontiguousarray(data.real).reshape(shape)
+        imag = np.ascontiguousarray(data.imag).reshape(shape)
+        return (real**2 + imag**2).sum(axis=2)
+    # The populations sit on the diagonal of a Hermitian ρ, so they only
+    # need its real part
+    rho = np.ascontiguousarray(data.real).reshape(
+        len(states), N_cavity, 2, N_cavity, 2)
+    return np.einsum('tnana->tn', rho)
+
+@functools.lru_cache(maxsize=None)
+def _cavity_operators(N_cavity, omega_c, omega_a):
+    """
+    Jaynes-Cummings operator skeleton, built once per parameter set.
+    
+    Returns a dict with the cavity annihilation operator, the bare
+    Hamiltonian H0, the exchange term H_int, the initial state and the
+    observables plotted by plot_cavity_qed. The operators are stored as
+    CSR so H, the collapse operator and the e_ops share one data layout.
+    """
+    a = qt.tensor(qt.destroy(N_cavity), qt.qeye(2))
+    a_dag = a.dag()
+    # The atom uses (|g⟩, |e⟩) = (_G, _E). QuTiP's sigmaz treats
+    # basis(2, 0) as the upper level, so the inversion is mirrored.
+    sigma_z = qt.tensor(qt.qeye(N_cavity), -_SZ)
+    sigma_plus = qt.tensor(qt.qeye(N_cavity), _SM.dag())
+    sigma_minus = qt.tensor(qt.qeye(N_cavity), _SM)
+    
+    ops = {
+        'a': a,
+        'H0': omega_c * a_dag * a + omega_a/2 * sigma_z,
+        'H_int': a_dag * sigma_minus + a * sigma_plus,
+        'P_excited': sigma_plus * sigma_minus,
+        'n_photons': a_dag * a,
+    }
+    ops = {name: op.to("csr") for name, op in ops.items()}
+    # Initial state: vacuum cavity + excited atom
+    ops['psi0'] = qt.tensor(qt.basis(N_cavity, 0), _E)
+    return ops
+
+# The solvers below are memoized on their (rounded) slider values, so moving
+# a slider back or switching demos and back reuses the earlier solve. The
+# returned arrays are shared between calls and must not be modified in place.
+
+@functools.lru_cache(maxsize=32)
+def _solve_rabi(omega_rabi, detuning, t_max):
+    """
+    Driven two-level evolution from |0⟩.
+    
+    H = (ω₀ + Δ)/2 σz + Ω/2 σx is static, so the state is propagated in
+    closed form at every time point at once instead of with an ODE solve.
+    
+    Returns (t_points, P_excited, bloch) with bloch the (3, T) trajectory.
+    """
+    t_points = np.linspace(0, t_max, 200)
+    
+    # Hamiltonian H = (ω·σ)/2 with ω = (Ω, 0, ω₀ + Δ)
+    omega_0 = 1.0
+    omega_z = omega_0 + detuning
+    
+    # U(t) = cos(Ωt/2) I - i sin(Ωt/2) n̂·σ with Ω = |ω| and n̂ = ω/Ω; for
+    # ψ(0) = |0⟩ the amplitudes are c₀ = cos - i n_z sin, c₁ = -i n_x sin
+    Omega = np.hypot(omega_rabi, omega_z)
+    phase = Omega * t_points / 2
+    c0 = np.cos(phase) - 1j * (omega_z / Omega) * np.sin(phase)
+    c1 = -1j * (omega_rabi / Omega) * np.sin(phase)
+    
+    # Observables: P₁ = |c₁|², ⟨σx⟩ + i⟨σy⟩ = 2 c₀* c₁, ⟨σz⟩ = |c₀|² - |c₁|²
+    P_excited = np.abs(c1)**2
+    coh = 2 * np.conj(c0) * c1
+    bloch = np.array([coh.real, coh.imag, 1 - 2*P_excited])
+    return t_points, P_excited, bloch
+
+@functools.lru_cache(maxsize=32)
+def _solve_decoherence(gamma, gamma_phi, t_max):
+    """
+    Closed and open evolution of |+⟩ under H = σz/2.
+    
+    Returns (t_points, coherence_closed, bloch_open) with bloch_open the
+    (3, T) open-system trajectory.
+    """
+    t_points = np.linspace(0, t_max, 200)
+    
+    # Hamiltonian
+    H = 0.5 * _SZ
+    
+    # Collapse operators
+    c_ops = []
+    if gamma > 0:
+        c_ops.append(np.sqrt(gamma) * _SM)
+    if gamma_phi > 0:
+        c_ops.append(np.sqrt(gamma_phi) * _SZ)
+    
+    # Without the environment, σz/2 only rotates the phase of ρ₀₁, so the
+    # closed coherence stays at its initial |ρ₀₁| = 1/2 and needs no solve
+    coherence_closed = np.full_like(t_points, 0.5)
+    
+    # The open system's Liouvillian is a constant 4x4 generator and the time
+    # grid is uniform, so a single propagator exp(L·dt) advances vec(ρ)
+    # exactly from each sample to the next, with no ODE solve
+    L = qt.liouvillian(H, c_ops).full()
+    step = expm(L * (t_points[1] - t_points[0]))
+    rho_vec = np.empty((len(t_points), 4), dtype=complex)
+    rho_vec[0] = qt.operator_to_vector(qt.ket2dm(_PLUS)).full().ravel()
+    for k in range(1, len(t_points)):
+        rho_vec[k] = step @ rho_vec[k - 1]
+    
+    # vec(ρ) stacks columns, (ρ₀₀, ρ₁₀, ρ₀₁, ρ₁₁), so the Bloch vector is
+    # (2 Re ρ₁₀, 2 Im ρ₁₀, ρ₀₀ - ρ₁₁); the plot takes the coherence from
+    # ρ₀₁ = (⟨σx⟩ + i⟨σy⟩)/2
+    rho10 = rho_vec[:, 1]
+    bloch_open = np.array([2*rho10.real, 2*rho10.imag,
+                           (rho_vec[:, 0] - rho_vec[:, 3]).real])
+    return t_points, coherence_closed, bloch_open
+
+@functools.lru_cache(maxsize=32)
+def _solve_cavity(g, kappa, t_max, N_cavity, omega_c, omega_a):
+    """
+    Jaynes-Cummings evolution of |0, e⟩ with optional cavity decay.
+    
+    Returns (t_points, P_excited, n_photons, snapshot_times, photon_probs),
+    where photon_probs holds the photon-number distribution at each of
+    snapshot_times, shape (len(snapshot_times), N_cavity).
+    
+    The solver only samples as densely as the atom-cavity exchange needs;
+    the expectation values are interpolated onto the display grid.
+    """
+    # |0, e⟩ stays in the single-excitation manifold, where everything
+    # oscillates at the vacuum Rabi frequency √(4g² + Δ²)
+    rabi_freq = np.hypot(2 * g, omega_a - omega_c)
+    n_solve = int(np.ceil(_SAMPLES_PER_PERIOD * rabi_freq * t_max / (2 * np.pi)))
+    n_solve = min(max(n_solve + 1, _MIN_SOLVER_POINTS), _DISPLAY_POINTS)
+    t_solve = np.linspace(0, t_max, n_solve)
+    
+    # Create Hamiltonian: only g changes between slider ticks, so it is a
+    # linear combination of the cached operator skeleton
+    ops = _cavity_operators(N_cavity, omega_c, omega_a)
+    H = ops['H0'] + g * ops['H_int']
+    
+    # Collapse operators
+    c_ops = []
+    if kappa > 0:
+        c_ops.append(np.sqrt(kappa) * ops['a'])
+    
+    # Solve evolution; the energies come from e_ops, the states are kept
+    # for the photon-statistics snapshots
+    result = qt.mesolve(H, ops['psi0'], t_solve, c_ops,
+                        e_ops=[ops['P_excited'], ops['n_photons']],
+                        options={**_SOLVER_OPTS, "store_states": True})
+    
+    t_points = np.linspace(0, t_max, _DISPLAY_POINTS)
+    P_excited, n_photons = (np.interp(t_points, t_solve, values)
+                            for values in result.expect)
+    
+    T = len(t_solve)
+    snapshots = [0, T//3, 2*T//3, T - 1]
+    photon_probs = _photon_distributions(
+        [result.states[idx] for idx in snapshots], N_cavity)
+    return t_points, P_excited, n_photons, t_solve[snapshots], photon_probs
+
+# Demos each slider applies to; the others are hidden while a demo is shown
+_SLIDER_DEMOS = {
+    'omega_rabi': ('rabi',),
+    'detuning': ('rabi',),
+    'time_max': ('rabi', 'decoherence', 'cavity'),
+    'gamma': ('decoherence',),
+    'gamma_phi': ('decoherence',),
+    'coupling': ('cavity',),
+    'cavity_decay': ('cavity',),
+}
+
 class InteractiveQuTiPDemo:
     """Interactive QuTiP demonstration with matplotlib widgets."""
     
@@ -33,6 +239,13 @@ class InteractiveQuTiPDemo:
         """Initialize the interactive demo."""
         self.fig = None
         self.current_demo = 'rabi'
+        self._dirty = False
+        # Line artists reused across slider ticks and the blitting background
+        # captured without them (see _redraw)
+        self._artists = None
+        self._bloch_artists = None
+        self._background = None
+        self._own_draw = False
         self.setup_interface()
         
     def setup_interface(self):
@@ -41,6 +254,14 @@ class InteractiveQuTiPDemo:
         self.fig.suptitle('🌟 Interactive QuTiP Demo: Quantum Dynamics Visualizer', 
                          fontsize=16, fontweight='bold')
         
+        # Single-shot timer that coalesces slider ticks into one redraw
+        self._redraw_timer = self.fig.canvas.new_timer(interval=150)
+        self._redraw_timer.single_shot = True
+        self._redraw_timer.add_callback(self._flush_pending_update)
+        # Any full draw we didn't make ourselves (resize, widget hover, ...)
+        # may have changed what the blitting background should contain
+        self.fig.canvas.mpl_connect('draw_event', self._invalidate_background)
+        
         # Create subplot layout
         # Controls on the left, main plots on the right
         self.ax_controls = plt.subplot2grid((4, 4), (0, 0), rowspan=4, colspan=1)
@@ -48,18 +269,28 @@ class InteractiveQuTiPDemo:
         self.ax_main2 = plt.subplot2grid((4, 4), (2, 1), rowspan=2, colspan=2, projection='3d')
         self.ax_info = plt.subplot2grid((4, 4), (0, 3), rowspan=4, colspan=1)
         
+        # One Bloch sphere shared by the Rabi and decoherence demos
+        self._bloch = qt.Bloch(fig=self.fig, axes=self.ax_main2)
+        
         # Remove axes for control and info panels
         self.ax_controls.set_xticks([])
         self.ax_controls.set_yticks([])
         self.ax_info.set_xticks([])
         self.ax_info.set_yticks([])
         
-        self.setup_controls()
+        self._build_controls_once()
+        self._refresh_active_sliders(self.current_demo)
         self.setup_info_panel()
         self.update_plots()
         
-    def setup_controls(self):
-        """Set up control widgets."""
+    def _build_controls_once(self):
+        """
+        Create the control widgets.
+        
+        Called once from setup_interface: switching demos only changes which
+        sliders are shown (see _refresh_active_sliders), so no widget axes
+        are ever rebuilt.
+        """
         self.ax_controls.clear()
         self.ax_controls.set_title('🎛️ Controls', fontweight='bold', pad=20)
         
@@ -94,18 +325,20 @@ class InteractiveQuTiPDemo:
         button_spacing = 0.05
         
         self.demo_buttons = {}
+        self._button_demos = {}
         demos = [('Rabi Oscillations', 'rabi'), ('Decoherence', 'decoherence'), ('Cavity QED', 'cavity')]
         
         for i, (name, key) in enumerate(demos):
             ax_button = plt.axes([0.02, button_y - i*button_spacing, 0.15, button_height])
             button = Button(ax_button, name)
-            button.on_clicked(lambda x, demo=key: self.switch_demo(demo))
+            button.on_clicked(self._on_demo_clicked)
             self.demo_buttons[key] = button
+            self._button_demos[ax_button] = key
         
         # Update button
         ax_update = plt.axes([0.02, 0.02, 0.15, button_height])
         self.update_button = Button(ax_update, '🔄 Update', color='lightgreen')
-        self.update_button.on_clicked(lambda x: self.update_plots())
+        self.update_button.on_clicked(self._on_update_clicked)
         
         # Hide control axes
         self.ax_controls.set_xlim(0, 1)
@@ -117,19 +350,51 @@ class InteractiveQuTiPDemo:
         """Create a parameter slider."""
         ax_slider = plt.axes([0.02, y_pos, 0.15, 0.02])
         slider = Slider(ax_slider, label, vmin, vmax, valinit=vinit, valfmt='%.3f')
-        slider.on_changed(lambda val: self.on_slider_change())
+        # Redrawn by _blit_sliders instead of a full-figure draw_idle per tick
+        slider.drawon = False
+        slider.on_changed(self.on_slider_change)
         
         self.slider_axes[name] = ax_slider
         self.sliders[name] = slider
     
-    def on_slider_change(self):
-        """Handle slider value changes."""
-        # Update plots when sliders change
+    def _refresh_active_sliders(self, demo):
+        """Show only the sliders that apply to `demo`."""
+        for name, ax in self.slider_axes.items():
+            ax.set_visible(demo in _SLIDER_DEMOS[name])
+    
+    def _active_slider_axes(self):
+        """Axes of the sliders shown for the current demo."""
+        return [ax for name, ax in self.slider_axes.items()
+                if self.current_demo in _SLIDER_DEMOS[name]]
+    
+    def _on_demo_clicked(self, event):
+        """Switch to the demo of the clicked button."""
+        self.switch_demo(self._button_demos[event.inaxes])
+    
+    def _on_update_clicked(self, event):
+        """Redraw the plots on request."""
         self.update_plots()
     
+    def on_slider_change(self, val=None):
+        """Handle slider value changes."""
+        # Dragging a slider fires a callback per pixel of motion; mark the
+        # plots stale and (re)start the timer so the solvers only run once
+        # the slider has been still for 150 ms
+        self._dirty = True
+        self._redraw_timer.start()
+        self._blit_sliders()
+    
+    def _flush_pending_update(self):
+        """Redraw if a slider change is still pending."""
+        if self._dirty:
+            self.update_plots()
+    
     def switch_demo(self, demo_type):
         """Switch between different demo types."""
         self.current_demo = demo_type
+        self._refresh_active_sliders(demo_type)
+        self._artists = None
+        self._bloch_artists = None
         self.update_info_panel()
         self.update_plots()
     
@@ -229,167 +494,235 @@ Applications:
     
     def get_current_parameters(self):
         """Get current parameter values from sliders."""
+        # Rounded to the displayed precision so nearby slider positions share
+        # a cached solve
         params = {}
         for name, slider in self.sliders.items():
-            params[name] = slider.val
+            params[name] = round(slider.val, 3)
         return params
     
     def update_plots(self):
         """Update the main plots based on current demo and parameters."""
+        self._dirty = False
         params = self.get_current_parameters()
         
-        if self.current_demo == 'rabi':
-            self.plot_rabi_oscillations(params)
-        elif self.current_demo == 'decoherence':
-            self.plot_decoherence(params)
-        elif self.current_demo == 'cavity':
-            self.plot_cavity_qed(params)
-        
-        self.fig.canvas.draw()
+        # qt.Bloch.render() draws the canvas itself when the sphere is set
+        # up; that draw happens before the blit and must not invalidate the
+        # background
+        self._own_draw = True
+        try:
+            if self.current_demo == 'rabi':
+                self.plot_rabi_oscillations(params)
+            elif self.current_demo == 'decoherence':
+                self.plot_decoherence(params)
+            elif self.current_demo == 'cavity':
+                self.plot_cavity_qed(params)
+        finally:
+            self._own_draw = False
+        
+        self._redraw()
+    
+    def _redraw(self):
+        """
+        Push the updated plots to the canvas.
+        
+        When the current plot registered reusable line artists, only those,
+        the legend, the title, the Bloch trajectory and the sliders are drawn
+        over a cached background of everything else; the full figure is
+        rendered only when the layout changes or another full draw has
+        happened.
+        """
+        canvas = self.fig.canvas
+        if self._artists is None or not canvas.supports_blit:
+            canvas.draw()
+            return
+        
+        title = self.ax_main1.title
+        animated = [*self._artists['lines'].values(), self.ax_main1.get_legend(),
+                    *(self._bloch_artists or []), *self._active_slider_axes()]
+        if self._background is None:
+            renderer = canvas.get_renderer()
+            # Padded so a wider value label still falls inside the region
+            self._slider_region = Bbox.union(
+                [ax.get_tightbbox(renderer) for ax in self._active_slider_axes()]
+            ).padded(20)
+            # The title is blanked rather than hidden: a hidden title has a
+            # unit extent, which throws off the axes' title placement
+            text = title.get_text()
+            title.set_text('')
+            for artist in animated:
+                artist.set_visible(False)
+            self._own_draw = True
+            try:
+                canvas.draw()
+            finally:
+                self._own_draw = False
+            self._background = canvas.copy_from_bbox(self.fig.bbox)
+            for artist in animated:
+                artist.set_visible(True)
+            title.set_text(text)
+        else:
+            canvas.restore_region(self._background)
+        
+        for artist in [*animated, title]:
+            # 3D artists are normally projected by Axes3D.draw, which the
+            # blit skips
+            if hasattr(artist, 'do_3d_projection'):
+                artist.do_3d_projection()
+            self.fig.draw_artist(artist)
+        canvas.blit(self.fig.bbox)
+    
+    def _blit_sliders(self):
+        """Redraw just the sliders, leaving the plots untouched."""
+        canvas = self.fig.canvas
+        if self._background is None:
+            canvas.draw_idle()
+            return
+        canvas.restore_region(self._background, bbox=self._slider_region)
+        for ax in self._active_slider_axes():
+            self.fig.draw_artist(ax)
+        canvas.blit(self._slider_region)
+    
+    def _invalidate_background(self, event=None):
+        """Drop the cached blitting background after any outside full draw."""
+        if not self._own_draw:
+            self._background = None
+    
+    def _line_artists(self, layout):
+        """Return the cached line artists if they were built for `layout`."""
+        if self._artists is not None and self._artists['layout'] == layout:
+            return self._artists['lines']
+        return None
+    
+    def _store_line_artists(self, layout, lines):
+        """Cache freshly built line artists; the background must be retaken."""
+        self._artists = {'layout': layout, 'lines': lines}
+        self._background = None
     
     def plot_rabi_oscillations(self, params):
         """Plot Rabi oscillations demonstration."""
-        # Clear axes
-        self.ax_main1.clear()
-        self.ax_main2.clear()
-        
         # Parameters
         omega_rabi = params['omega_rabi']
         detuning = params['detuning']
         t_max = params['time_max']
         
-        # Time evolution
-        t_points = np.linspace(0, t_max, 200)
-        
-        # Initial state: ground state
-        psi0 = qt.basis(2, 0)
-        
-        # Hamiltonian
-        omega_0 = 1.0
-        H = (omega_0 + detuning)/2 * qt.sigmaz() + omega_rabi/2 * qt.sigmax()
-        
         # Solve evolution
-        result = qt.mesolve(H, psi0, t_points, [], [])
-        
-        # Calculate observables
-        P_excited = [qt.expect(qt.num(2), state) for state in result.states]
-        bloch_x = [qt.expect(qt.sigmax(), state) for state in result.states]
-        bloch_y = [qt.expect(qt.sigmay(), state) for state in result.states]
-        bloch_z = [qt.expect(qt.sigmaz(), state) for state in result.states]
-        
-        # Plot 1: Population dynamics
-        self.ax_main1.plot(t_points, P_excited, 'r-', linewidth=2, label='Excited |1⟩')
-        self.ax_main1.plot(t_points, 1-np.array(P_excited), 'b-', linewidth=2, label='Ground |0⟩')
-        
-        # Add theoretical curve for resonant case
-        if abs(detuning) < 0.01:
-            theory = 0.5 * (1 - np.cos(omega_rabi * t_points))
-            self.ax_main1.plot(t_points, theory, 'k--', alpha=0.7, label='Theory')
+        t_points, P_excited, bloch_vectors = _solve_rabi(omega_rabi, detuning, t_max)
+        
+        # Plot 1: Population dynamics, with the theoretical curve for the
+        # resonant case. The axes are only rebuilt when the time axis or the
+        # set of curves changes; otherwise the cached lines get new data.
+        show_theory = abs(detuning) < 0.01
+        curves = {'excited': P_excited, 'ground': 1 - P_excited}
+        if show_theory:
+            curves['theory'] = 0.5 * (1 - np.cos(omega_rabi * t_points))
+        
+        layout = ('rabi', t_max, show_theory)
+        lines = self._line_artists(layout)
+        if lines is None:
+            self.ax_main1.clear()
+            lines = {
+                'excited': self.ax_main1.plot(t_points, curves['excited'], 'r-',
+                                              linewidth=2, label='Excited |1⟩')[0],
+                'ground': self.ax_main1.plot(t_points, curves['ground'], 'b-',
+                                             linewidth=2, label='Ground |0⟩')[0],
+            }
+            if show_theory:
+                lines['theory'] = self.ax_main1.plot(t_points, curves['theory'], 'k--',
+                                                     alpha=0.7, label='Theory')[0]
+            
+            self.ax_main1.set_xlabel('Time')
+            self.ax_main1.set_ylabel('Population')
+            self.ax_main1.set_ylim(-0.05, 1.05)
+            self.ax_main1.legend()
+            self.ax_main1.grid(True, alpha=0.3)
+            self._store_line_artists(layout, lines)
+        else:
+            for name, line in lines.items():
+                line.set_ydata(curves[name])
         
-        self.ax_main1.set_xlabel('Time')
-        self.ax_main1.set_ylabel('Population')
         self.ax_main1.set_title(f'Rabi Oscillations: Ω={omega_rabi:.3f}, Δ={detuning:.3f}')
-        self.ax_main1.legend()
-        self.ax_main1.grid(True, alpha=0.3)
         
         # Plot 2: Bloch sphere
-        b = qt.Bloch()
-        b.fig = self.fig
-        b.axes = self.ax_main2
-        
-        # Add trajectory
-        bloch_vectors = np.array([bloch_x, bloch_y, bloch_z])
-        b.add_points(bloch_vectors)
-        
-        # Mark start and end points
-        b.add_vectors([bloch_x[0], bloch_y[0], bloch_z[0]], 'g')  # Start
-        b.add_vectors([bloch_x[-1], bloch_y[-1], bloch_z[-1]], 'r')  # End
-        
-        b.render()
-        self.ax_main2.set_title('Bloch Sphere Trajectory')
+        self._plot_bloch_trajectory(bloch_vectors, 'Bloch Sphere Trajectory')
+    
+    def _plot_bloch_trajectory(self, points, title):
+        """
+        Show a (3, T) trajectory on the Bloch sphere in ax_main2.
+        
+        The sphere is rendered once per demo; later updates only replace
+        the point and start/end vector artists, which _redraw blits over the
+        cached background.
+        """
+        b = self._bloch
+        if self._bloch_artists is None:
+            b.clear()
+            b.render()
+            self.ax_main2.set_title(title)
+            self._background = None
+        else:
+            for artist in self._bloch_artists:
+                artist.remove()
+            b.clear()
+        
+        b.add_points(points)
+        b.add_vectors(points[:, 0], 'g')   # Start
+        b.add_vectors(points[:, -1], 'r')  # End
+        
+        existing = set(self.ax_main2.get_children())
+        b.plot_points()
+        b.plot_vectors()
+        self._bloch_artists = [artist for artist in self.ax_main2.get_children()
+                               if artist not in existing]
     
     def plot_decoherence(self, params):
         """Plot quantum decoherence demonstration."""
-        # Clear axes
-        self.ax_main1.clear()
-        self.ax_main2.clear()
-        
         # Parameters
         gamma = params['gamma']
         gamma_phi = params['gamma_phi']
         t_max = params['time_max']
         
-        # Time evolution
-        t_points = np.linspace(0, t_max, 200)
-        
-        # Initial state: superposition
-        psi0 = (qt.basis(2, 0) + qt.basis(2, 1)).unit()
-        
-        # Hamiltonian
-        H = 0.5 * qt.sigmaz()
-        
-        # Collapse operators
-        c_ops = []
-        if gamma > 0:
-            c_ops.append(np.sqrt(gamma) * qt.sigmam())
-        if gamma_phi > 0:
-            c_ops.append(np.sqrt(gamma_phi) * qt.sigmaz())
-        
         # Solve evolution (closed and open systems)
-        result_closed = qt.mesolve(H, psi0, t_points, [], [])
-        result_open = qt.mesolve(H, psi0, t_points, c_ops, [])
-        
-        # Calculate coherence
-        def get_coherence(states):
-            coherence = []
-            for state in states:
-                if state.type == 'ket':
-                    rho = qt.ket2dm(state)
-                else:
-                    rho = state
-                coherence.append(abs(rho[0, 1]))
-            return coherence
-        
-        coherence_closed = get_coherence(result_closed.states)
-        coherence_open = get_coherence(result_open.states)
-        
-        # Plot 1: Coherence comparison
-        self.ax_main1.plot(t_points, coherence_closed, 'b-', linewidth=2, label='Closed System')
-        self.ax_main1.plot(t_points, coherence_open, 'r-', linewidth=2, label='Open System')
-        
-        # Add theoretical T2 decay
-        if gamma_phi > 0 or gamma > 0:
+        t_points, coherence_closed, bloch_open = _solve_decoherence(gamma, gamma_phi, t_max)
+        coherence_open = 0.5 * np.hypot(bloch_open[0], bloch_open[1])
+        
+        # Plot 1: Coherence comparison, with the theoretical T2 decay. As in
+        # plot_rabi_oscillations the cached lines are reused when possible.
+        show_theory = gamma_phi > 0 or gamma > 0
+        curves = {'closed': coherence_closed, 'open': coherence_open}
+        if show_theory:
             total_decay = gamma/2 + gamma_phi
-            theory = 0.5 * np.exp(-total_decay * t_points)
-            self.ax_main1.plot(t_points, theory, 'k--', alpha=0.7, label='Theory')
+            curves['theory'] = 0.5 * np.exp(-total_decay * t_points)
+        
+        layout = ('decoherence', t_max, show_theory)
+        lines = self._line_artists(layout)
+        if lines is None:
+            self.ax_main1.clear()
+            lines = {
+                'closed': self.ax_main1.plot(t_points, curves['closed'], 'b-',
+                                             linewidth=2, label='Closed System')[0],
+                'open': self.ax_main1.plot(t_points, curves['open'], 'r-',
+                                           linewidth=2, label='Open System')[0],
+            }
+            if show_theory:
+                lines['theory'] = self.ax_main1.plot(t_points, curves['theory'], 'k--',
+                                                     alpha=0.7, label='Theory')[0]
+            
+            self.ax_main1.set_xlabel('Time')
+            self.ax_main1.set_ylabel('Coherence |ρ₀₁|')
+            self.ax_main1.set_ylim(-0.025, 0.525)
+            self.ax_main1.legend()
+            self.ax_main1.grid(True, alpha=0.3)
+            self._store_line_artists(layout, lines)
+        else:
+            for name, line in lines.items():
+                line.set_ydata(curves[name])
         
-        self.ax_main1.set_xlabel('Time')
-        self.ax_main1.set_ylabel('Coherence |ρ₀₁|')
         self.ax_main1.set_title(f'Decoherence: γ={gamma:.3f}, γφ={gamma_phi:.3f}')
-        self.ax_main1.legend()
-        self.ax_main1.grid(True, alpha=0.3)
         
-        # Plot 2: Bloch sphere trajectory for open system
-        bloch_vectors = []
-        for state in result_open.states[::10]:  # Subsample for performance
-            bloch_vectors.append([
-                qt.expect(qt.sigmax(), state),
-                qt.expect(qt.sigmay(), state),
-                qt.expect(qt.sigmaz(), state)
-            ])
-        
-        b = qt.Bloch()
-        b.fig = self.fig
-        b.axes = self.ax_main2
-        
-        if bloch_vectors:
-            trajectory = np.array(bloch_vectors).T
-            b.add_points(trajectory)
-            b.add_vectors(bloch_vectors[0], 'g')   # Start
-            b.add_vectors(bloch_vectors[-1], 'r')  # End
-        
-        b.render()
-        self.ax_main2.set_title('Open System Trajectory')
+        # Plot 2: Bloch sphere trajectory for open system, subsampled
+        trajectory = bloch_open[:, ::10]
+        self._plot_bloch_trajectory(trajectory, 'Open System Trajectory')
     
     def plot_cavity_qed(self, params):
         """Plot cavity QED demonstration."""
@@ -407,32 +740,9 @@ Applications:
         omega_a = 1.0
         N_cavity = 8
         
-        # Time evolution
-        t_points = np.linspace(0, t_max, 200)
-        
-        # Create Hamiltonian
-        a = qt.tensor(qt.destroy(N_cavity), qt.qeye(2))
-        a_dag = a.dag()
-        sigma_plus = qt.tensor(qt.qeye(N_cavity), qt.sigmap())
-        sigma_minus = qt.tensor(qt.qeye(N_cavity), qt.sigmam())
-        
-        H = omega_c * a_dag * a + omega_a/2 * qt.tensor(qt.qeye(N_cavity), qt.sigmaz()) + \
-            g * (a_dag * sigma_minus + a * sigma_plus)
-        
-        # Initial state: vacuum cavity + excited atom
-        psi0 = qt.tensor(qt.basis(N_cavity, 0), qt.basis(2, 1))
-        
-        # Collapse operators
-        c_ops = []
-        if kappa > 0:
-            c_ops.append(np.sqrt(kappa) * a)
-        
         # Solve evolution
-        result = qt.mesolve(H, psi0, t_points, c_ops, [])
-        
-        # Calculate observables
-        P_excited = [qt.expect(sigma_plus * sigma_minus, state) for state in result.states]
-        n_photons = [qt.expect(a_dag * a, state) for state in result.states]
+        t_points, P_excited, n_photons, time_labels, photon_probs = _solve_cavity(
+            g, kappa, t_max, N_cavity, omega_c, omega_a)
         
         # Plot 1: Energy exchange
         self.ax_main1.plot(t_points, P_excited, 'r-', linewidth=2, label='Atomic Energy')
@@ -442,7 +752,6 @@ Applications:
         if kappa == 0:
             rabi_freq = 2 * g
             theory_atom = 0.5 * (1 + np.cos(rabi_freq * t_points))
-            theory_cavity = 0.5 * (1 - np.cos(rabi_freq * t_points))
             self.ax_main1.plot(t_points, theory_atom, 'k--', alpha=0.7, label='Theory')
         
         self.ax_main1.set_xlabel('Time')
@@ -453,28 +762,15 @@ Applications:
         
         # Plot 2: 3D visualization of photon number distribution evolution
         # Show photon number probability at a few time points
-        times_to_show = [0, len(result.states)//3, 2*len(result.states)//3, -1]
-        time_labels = [t_points[i] for i in times_to_show]
-        
-        # Calculate photon distributions
-        photon_probs = []
         max_n = min(6, N_cavity)
-        
-        for idx in times_to_show:
-            state = result.states[idx]
-            probs = []
-            for n in range(max_n):
-                proj_n = qt.tensor(qt.basis(N_cavity, n) * qt.basis(N_cavity, n).dag(), 
-                                 qt.qeye(2))
-                probs.append(qt.expect(proj_n, state))
-            photon_probs.append(probs)
+        photon_probs = photon_probs[:, :max_n]
         
         # Create 3D bar plot
         self.ax_main2.clear()
         
         # Set up 3D bar chart
         x_pos = np.arange(max_n)
-        y_pos = np.arange(len(times_to_show))
+        y_pos = np.arange(len(time_labels))
         
         for i, (probs, time_label) in enumerate(zip(photon_probs, time_labels)):
             self.ax_main2.bar(x_pos, probs, zs=i, zdir='y', alpha=0.7, 
@@ -11,6 +11,28 @@ License: MIT
 
 import sys
 import os
+import importlib
+from importlib import metadata
+
+# The demo modules live next to this directory; put them on the path once
+DEMO_DIR = os.path.join(os.path.dirname(__file__), '..', 'demos')
+sys.path.insert(0, DEMO_DIR)
+
+# Menu choice -> (start message, demo module)
+DEMOS = {
+    '1': ("🎯 Starting Bloch Sphere & Rabi Oscillations Demo...", 'bloch_rabi_demo'),
+    '2': ("🌀 Starting Quantum Decoherence Demo...", 'decoherence_demo'),
+    '3': ("🔬 Starting Cavity QED Demo...", 'cavity_qed_demo'),
+    '4': ("🎮 Starting Interactive Demo...", 'interactive_demo'),
+    '5': ("🔑 Starting Bernstein-Vazirani Algorithm Demo...", 'bernstein_vazirani_demo'),
+}
+
+# Demos run in sequence by the "run all" choice
+ALL_DEMOS = [
+    ("Bloch Sphere & Rabi Oscillations", 'bloch_rabi_demo'),
+    ("Quantum Decoherence", 'decoherence_demo'),
+    ("Cavity QED", 'cavity_qed_demo'),
+]
 
 def print_banner():
     """Print welcome banner."""
@@ -58,69 +80,19 @@ def print_menu():
 def run_demo(choice):
     """Run the selected demonstration."""
     try:
-        if choice == '1':
-            print("🎯 Starting Bloch Sphere & Rabi Oscillations Demo...")
-            import sys
-            import os
-            sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'demos'))
-            import bloch_rabi_demo
-            bloch_rabi_demo.main()
-            
-        elif choice == '2':
-            print("🌀 Starting Quantum Decoherence Demo...")
-            import sys
-            import os
-            sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'demos'))
-            import decoherence_demo
-            decoherence_demo.main()
-            
-        elif choice == '3':
-            print("🔬 Starting Cavity QED Demo...")
-            import sys
-            import os
-            sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'demos'))
-            import cavity_qed_demo
-            cavity_qed_demo.main()
-            
-        elif choice == '4':
-            print("🎮 Starting Interactive Demo...")
-            import sys
-            import os
-            sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'demos'))
-            import interactive_demo
-            interactive_demo.main()
-            
-        elif choice == '5':
-            print("🔑 Starting Bernstein-Vazirani Algorithm Demo...")
-            import sys
-            import os
-            sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'demos'))
-            import bernstein_vazirani_demo
-            bernstein_vazirani_demo.main()
+        if choice in DEMOS:
+            message, module = DEMOS[choice]
+            print(message)
+            importlib.import_module(module).main()
             
         elif choice == '6':
             print("📊 Running All QuTiP Demos...")
-            import sys
-            import os
-            sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'demos'))
-            
-            print("\n" + "="*60)
-            print("Demo 1/3: Bloch Sphere & Rabi Oscillations")
-            print("="*60)
-            import bloch_rabi_demo
-            bloch_rabi_demo.main()
-            
-            print("\n" + "="*60)
-            print("Demo 2/3: Quantum Decoherence")
-            print("="*60)
-            import decoherence_demo
-            decoherence_demo.main()
             
-            print("\n" + "="*60)
-            print("Demo 3/3: Cavity QED")
-            print("="*60)
-            import cavity_qed_demo
-            cavity_qed_demo.main()
+            for i, (title, module) in enumerate(ALL_DEMOS, 1):
+                print("\n" + "="*60)
+                print(f"Demo {i}/{len(ALL_DEMOS)}: {title}")
+                print("="*60)
+                importlib.import_module(module).main()
             
             print("\n🎉 All QuTiP demos completed!")
             
@@ -141,32 +113,21 @@ def run_demo(choice):
         return False
 
 def check_dependencies():
-    """Check if required dependencies are available."""
-    missing_deps = []
-    
-    try:
-        import qutip
-        print(f"✅ QuTiP version {qutip.__version__} found")
-    except ImportError:
-        missing_deps.append("qutip")
-    
-    try:
-        import numpy
-        print(f"✅ NumPy version {numpy.__version__} found")
-    except ImportError:
-        missing_deps.append("numpy")
+    """
+    Check if required dependencies are available.
     
-    try:
-        import matplotlib
-        print(f"✅ Matplotlib version {matplotlib.__version__} found")
-    except ImportError:
-        missing_deps.append("matplotlib")
+    Only the installed distribution metadata is read here, so the menu
+    starts without importing QuTiP and friends; each demo imports what it
+    needs when it is chosen.
+    """
+    missing_deps = []
     
-    try:
-        import scipy
-        print(f"✅ SciPy version {scipy.__version__} found")
-    except ImportError:
-        missing_deps.append("scipy")
+    for dist, label in [("qutip", "QuTiP"), ("numpy", "NumPy"),
+                        ("matplotlib", "Matplotlib"), ("scipy", "SciPy")]:
+        try:
+            print(f"✅ {label} version {metadata.version(dist)} found")
+        except metadata.PackageNotFoundError:
+            missing_deps.append(dist)
     
     if missing_deps:
         print(f"\n❌ Missing dependencies: {', '.join(missing_deps)}")
@@ -6,113 +6,409 @@ This script verifies that all dependencies are properly installed
 and the demo code will run correctly.
 
 Run this script after installing requirements.txt to ensure everything works.
+Run it from the project root, which the demo file paths are relative to.
+Its run time is almost all QuTiP's own import in the functionality test;
+the dependency and file checks read only metadata and cached bytecode.
 """
 
+import io
+import os
 import sys
+import argparse
+import contextlib
+import json
+import hashlib
+import tempfile
+import functools
+import py_compile
+import traceback
 import importlib
+import importlib.util
+from importlib import metadata
+from importlib import import_module as _import_module
+from concurrent.futures import ThreadPoolExecutor
 
-def check_dependency(module_name, package_name=None):
-    """Check if a module can be imported."""
+# Whether a module is installed only needs the import system's finders, not
+# an import: locating the spec runs none of the package's top-level code
+_find_spec = functools.lru_cache(maxsize=None)(importlib.util.find_spec)
+
+# Installed distributions whose name differs from the module they provide
+_DISTRIBUTIONS = {
+    'qiskit_aer': 'qiskit-aer',
+}
+
+@functools.lru_cache(maxsize=None)
+def _distribution_version(module_name):
+    """Version of the distribution providing a module, read from its metadata."""
+    try:
+        return metadata.version(_DISTRIBUTIONS.get(module_name, module_name))
+    except metadata.PackageNotFoundError:
+        return 'unknown'
+
+# Emoji only on an interactive terminal; logs and pipes get greppable ASCII
+_EMOJI = sys.stdout.isatty() and os.environ.get('TERM') not in (None, 'dumb')
+_OK = '✅' if _EMOJI else '[OK]'
+_FAIL = '❌' if _EMOJI else '[FAIL]'
+
+def _icon(glyph):
+    """A decorative emoji and its trailing space, or nothing without emoji."""
+    return f"{glyph} " if _EMOJI else ""
+
+# Status line templates; each check collects its lines and writes them at once
+_FOUND = f"{_OK} {{}} v{{}}\n".format
+_NOT_FOUND = f"{_FAIL} {{}} - NOT FOUND\n".format
+_FILE_OK = f"{_OK} {{}}\n".format
+_SYNTAX_ERROR = f"{_FAIL} {{}} - SYNTAX ERROR: {{}}\n".format
+_UNREADABLE = f"{_FAIL} {{}} - UNREADABLE: {{}}\n".format
+
+# Required dependencies, as (module, display name)
+_DEPENDENCIES = (
+    ('qutip', 'QuTiP'),
+    ('numpy', 'NumPy'),
+    ('scipy', 'SciPy'),
+    ('matplotlib', 'Matplotlib'),
+    ('tqdm', 'tqdm'),
+)
+
+# Needed only by the Qiskit demos
+_OPTIONAL_DEPENDENCIES = (
+    ('qiskit', 'Qiskit'),
+    ('qiskit_aer', 'Qiskit Aer'),
+)
+
+# Sources syntax-checked by main, relative to the project root
+_DEMO_FILES = (
+    'demos/bloch_rabi_demo.py',
+    'demos/decoherence_demo.py',
+    'demos/cavity_qed_demo.py',
+    'demos/interactive_demo.py',
+    'demos/bernstein_vazirani_demo.py',
+    'utils/run_demos.py',
+)
+
+def _write_lines(lines):
+    """Write a batch of status lines with a single write and flush."""
+    sys.stdout.write("".join(lines))
+    sys.stdout.flush()
+
+def _probe_dependency(module_name, package_name=None):
+    """
+    Look a module up without importing it; return (ok, status line).
+    
+    Presence comes from the module's import spec and the version from its
+    installed distribution metadata.
+    """
     if package_name is None:
         package_name = module_name
     
+    if _find_spec(module_name) is None:
+        return False, _NOT_FOUND(package_name)
+    return True, _FOUND(package_name, _distribution_version(module_name))
+
+def check_dependencies(dependencies):
+    """
+    Check a list of (module, name) pairs concurrently.
+    
+    Status lines are printed in list order once every lookup has finished.
+    Returns one bool per pair.
+    """
+    modules, names = zip(*dependencies)
+    with ThreadPoolExecutor(max_workers=len(modules)) as executor:
+        results = list(executor.map(_probe_dependency, modules, names))
+    _write_lines([line for _, line in results])
+    return [ok for ok, _ in results]
+
+def _bytecode_is_current(filename, cfile):
+    """Whether cfile is a timestamp pyc matching the source's mtime and size."""
     try:
-        module = importlib.import_module(module_name)
-        version = getattr(module, '__version__', 'unknown')
-        print(f"✅ {package_name} v{version}")
-        return True
-    except ImportError:
-        print(f"❌ {package_name} - NOT FOUND")
+        with open(cfile, 'rb') as f:
+            header = f.read(16)
+    except OSError:
         return False
+    st = os.stat(filename)
+    return (len(header) == 16
+            and header[:4] == importlib.util.MAGIC_NUMBER
+            and int.from_bytes(header[4:8], 'little') == 0
+            and int.from_bytes(header[8:12], 'little') == int(st.st_mtime) & 0xFFFFFFFF
+            and int.from_bytes(header[12:16], 'little') == st.st_size & 0xFFFFFFFF)
 
-def check_qutip_functionality():
-    """Test basic QuTiP functionality."""
+def _check_demo_file(filename):
+    """
+    Syntax-check an existing source file; return (ok, status line).
+    
+    The file is compiled into its __pycache__ entry, the same one the import
+    system uses, so a later run or import whose bytecode is still current
+    for the source skips the parse entirely. When bytecode writing is
+    disabled (sys.dont_write_bytecode, PYTHONDONTWRITEBYTECODE) or the
+    cache directory is not writable, the source is compiled in memory
+    instead. Missing files are filtered out by check_demo_files before this
+    is called.
+    """
+    cfile = importlib.util.cache_from_source(filename)
+    if _bytecode_is_current(filename, cfile):
+        return True, _FILE_OK(filename)
+    if not sys.dont_write_bytecode:
+        try:
+            py_compile.compile(filename, cfile=cfile, doraise=True)
+            return True, _FILE_OK(filename)
+        except py_compile.PyCompileError as e:
+            return False, _SYNTAX_ERROR(filename, e.exc_value)
+        except OSError:
+            pass  # e.g. a read-only checkout; fall back to compiling in memory
     try:
-        import qutip as qt
-        import numpy as np
+        with open(filename, 'rb') as f:
+            compile(f.read(), filename, 'exec')
+    except (SyntaxError, ValueError) as e:
+        return False, _SYNTAX_ERROR(filename, e)
+    except OSError as e:
+        return False, _UNREADABLE(filename, e.strerror or e)
+    return True, _FILE_OK(filename)
+
+def _existing_files(filenames):
+    """Paths in filenames that are regular files, from one scan per directory."""
+    present = set()
+    for directory in {os.path.dirname(filename) for filename in filenames}:
+        try:
+            with os.scandir(directory or '.') as entries:
+                present.update(os.path.join(directory, entry.name)
+                               for entry in entries if entry.is_file())
+        except FileNotFoundError:
+            pass
+    return present
+
+def check_demo_files(filenames, strict=False):
+    """
+    Check that a list of source files exists, and with strict, that it compiles.
+    
+    Missing files are found by scanning their directories up front, so only
+    files known to exist are opened. The strict syntax checks run
+    concurrently. Status lines are printed in list order once every file is
+    checked. Returns one bool per file.
+    """
+    present = _existing_files(filenames)
+    if not strict:
+        results = [(True, _FILE_OK(filename)) if filename in present
+                   else (False, _NOT_FOUND(filename)) for filename in filenames]
+        _write_lines([line for _, line in results])
+        return [ok for ok, _ in results]
+    
+    found = [filename for filename in filenames if filename in present]
+    # A handful of small reads, mostly 16-byte pyc headers once the bytecode
+    # is current: overlapping them in threads is all the batching they need
+    with ThreadPoolExecutor(max_workers=max(len(found), 1)) as executor:
+        checked = dict(zip(found, executor.map(_check_demo_file, found)))
+    results = [checked.get(filename, (False, _NOT_FOUND(filename)))
+               for filename in filenames]
+    _write_lines([line for _, line in results])
+    return [ok for ok, _ in results]
+
+def _result_cache_file(strict=False):
+    """
+    Path of the cached result for the given mode.
+    
+    There is one file per mode, overwritten by each successful run; the
+    environment it was recorded in is identified by the fingerprint stored
+    inside it (see _result_fingerprint).
+    """
+    cache_home = (os.environ.get('XDG_CACHE_HOME')
+                  or os.path.join(os.path.expanduser('~'), '.cache'))
+    name = 'verify-strict.json' if strict else 'verify.json'
+    return os.path.join(cache_home, 'qutip-demo', name)
+
+def _result_fingerprint(strict=False):
+    """
+    Hash of everything a successful run depends on.
+    
+    That is the interpreter and its import path, the installed version of
+    every checked distribution, the stat of the demo files and of this
+    script, and whether the demo files were syntax-checked.
+    """
+    fingerprint = [sys.version, os.getcwd(), f"strict={strict}", *sys.path]
+    for module, _ in _DEPENDENCIES + _OPTIONAL_DEPENDENCIES:
+        version = _distribution_version(module) if _find_spec(module) else None
+        fingerprint.append(f"{module}={version}")
+    for filename in _DEMO_FILES + (os.path.abspath(__file__),):
+        try:
+            st = os.stat(filename)
+            fingerprint.append(f"{filename}:{st.st_mtime_ns}:{st.st_size}")
+        except OSError:
+            fingerprint.append(f"{filename}:missing")
+    return hashlib.sha256("\n".join(fingerprint).encode()).hexdigest()
+
+def _load_cached_result(path, fingerprint):
+    """
+    The cached result at path if it records a successful run in the
+    environment identified by fingerprint, else None.
+    """
+    try:
+        with open(path) as f:
+            result = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if (isinstance(result, dict) and result.get('ok') is True
+            and result.get('fingerprint') == fingerprint):
+        return result
+    return None
+
+def _store_result(path, result):
+    """Write a result atomically; an unwritable cache is silently skipped."""
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with tempfile.NamedTemporaryFile('w', dir=os.path.dirname(path),
+                                         suffix='.tmp', delete=False) as f:
+            json.dump(result, f)
+        os.replace(f.name, path)
+    except OSError:
+        pass
+
+def _cached_import(name):
+    """Return an already loaded module from sys.modules, importing it otherwise."""
+    module = sys.modules.get(name)
+    return module if module is not None else _import_module(name)
+
+def check_qutip_functionality(installed=None, verbose=False):
+    """
+    Test basic QuTiP functionality.
+    
+    installed optionally maps module names to the results of the dependency
+    check; if it already found QuTiP missing, the test is skipped instead of
+    searching for the module a second time. A failure is reported by its
+    exception type, or with its message too when verbose is set.
+    """
+    if installed is not None and not installed.get('qutip', True):
+        print(f"{_FAIL} QuTiP functionality test skipped - QuTiP NOT FOUND")
+        return False
+    
+    try:
+        qt = _cached_import('qutip')
         
-        # Test basic operations
-        psi = qt.basis(2, 0)
-        sx = qt.sigmax()
-        exp_val = qt.expect(sx, psi)
+        # Test basic operations: ⟨0|σx|0⟩ vanishes, so a wrong value means a
+        # broken linear-algebra backend rather than a missing module
+        exp_val = qt.expect(qt.sigmax(), qt.basis(2, 0))
+        if abs(exp_val) > 1e-12:
+            raise RuntimeError(f"⟨0|σx|0⟩ = {exp_val}, expected 0")
         
-        # Test Bloch sphere
-        b = qt.Bloch()
+        # Test Bloch sphere; no figure is created until it is rendered
+        qt.Bloch()
         
-        print("✅ QuTiP basic functionality works")
+        print(f"{_OK} QuTiP basic functionality works")
         return True
         
-    except Exception as e:
-        print(f"❌ QuTiP functionality test failed: {e}")
+    except (ImportError, AttributeError, TypeError, RuntimeError) as e:
+        if verbose:
+            reason = traceback.format_exception_only(type(e), e)[0].rstrip()
+        else:
+            reason = type(e).__name__
+        print(f"{_FAIL} QuTiP functionality test failed: {reason}")
         return False
 
-def main():
-    """Main verification function."""
-    print("🔍 QuTiP Demo Installation Verification")
+def main(use_cache=True, strict=False, verbose=False):
+    """
+    Main verification function.
+    
+    The demo files are only checked for presence unless strict is set, in
+    which case they are also compiled. A successful run is recorded as JSON
+    under $XDG_CACHE_HOME/qutip-demo (~/.cache/qutip-demo when that is
+    unset) together with a fingerprint of the environment it ran in (see
+    _result_fingerprint). With use_cache set, a later run in the same
+    environment reports that result and returns straight away.
+    
+    The report is collected and written to stdout in two writes: everything
+    up to the QuTiP functionality header goes out before the multi-second
+    QuTiP import, so the check never looks hung, and the rest when the
+    checks finish. With verbose, each line is printed as it is produced and
+    failures include their error messages.
+    """
+    if verbose:
+        return _verify(use_cache, strict, verbose)
+    out = io.StringIO()
+    flush = functools.partial(_flush_report, out, sys.stdout)
+    try:
+        with contextlib.redirect_stdout(out):
+            return _verify(use_cache, strict, verbose, flush=flush)
+    finally:
+        flush()
+
+def _flush_report(out, stdout):
+    """Write the lines collected in out to stdout and empty out."""
+    stdout.write(out.getvalue())
+    stdout.flush()
+    out.seek(0)
+    out.truncate()
+
+def _verify(use_cache, strict, verbose, flush=None):
+    """
+    Run the checks for main, printing the report.
+    
+    flush, if given, is called to emit the report so far before the QuTiP
+    functionality test.
+    """
+    print(f"{_icon('🔍')}QuTiP Demo Installation Verification")
     print("=" * 50)
     
-    # Required dependencies
-    dependencies = [
-        ('qutip', 'QuTiP'),
-        ('numpy', 'NumPy'),
-        ('scipy', 'SciPy'),
-        ('matplotlib', 'Matplotlib'),
-        ('tqdm', 'tqdm'),
-    ]
-    
-    print("📦 Checking Dependencies:")
-    all_deps_ok = True
-    
-    for module, name in dependencies:
-        if not check_dependency(module, name):
-            all_deps_ok = False
-    
-    print(f"\n🧪 Testing QuTiP Functionality:")
-    qutip_ok = check_qutip_functionality()
-    
-    print(f"\n📄 Checking Demo Files:")
-    demo_files = [
-        'demos/bloch_rabi_demo.py',
-        'demos/decoherence_demo.py', 
-        'demos/cavity_qed_demo.py',
-        'demos/interactive_demo.py',
-        'demos/bernstein_vazirani_demo.py',
-        'utils/run_demos.py'
-    ]
-    
-    files_ok = True
-    for filename in demo_files:
-        try:
-            with open(filename, 'r') as f:
-                compile(f.read(), filename, 'exec')
-            print(f"✅ {filename}")
-        except FileNotFoundError:
-            print(f"❌ {filename} - NOT FOUND")
-            files_ok = False
-        except SyntaxError as e:
-            print(f"❌ {filename} - SYNTAX ERROR: {e}")
-            files_ok = False
+    cache_file = _result_cache_file(strict) if use_cache else None
+    fingerprint = _result_fingerprint(strict) if use_cache else None
+    cached = cache_file and _load_cached_result(cache_file, fingerprint)
+    if cached:
+        print(f"{_OK} Already verified with this Python, these packages and demo files.")
+        if not cached.get('qiskit'):
+            print("   Qiskit demos require additional installation.")
+        return True
+    
+    print(f"{_icon('📦')}Checking Dependencies:")
+    results = check_dependencies(_DEPENDENCIES + _OPTIONAL_DEPENDENCIES)
+    all_deps_ok = all(results[:len(_DEPENDENCIES)])
+    qiskit_ok = all(results[len(_DEPENDENCIES):])
+    installed = {module: ok for (module, _), ok in
+                 zip(_DEPENDENCIES + _OPTIONAL_DEPENDENCIES, results)}
+    
+    print(f"\n{_icon('🧪')}Testing QuTiP Functionality:")
+    if flush:
+        flush()
+    qutip_ok = check_qutip_functionality(installed, verbose=verbose)
+    
+    print(f"\n{_icon('📄')}Checking Demo Files:")
+    files_ok = all(check_demo_files(_DEMO_FILES, strict=strict))
     
     print("\n" + "=" * 50)
     
-    if all_deps_ok and qutip_ok and files_ok and qiskit_ok:
-        print("🎉 SUCCESS! Everything is properly installed and ready to use.")
-    elif all_deps_ok and qutip_ok and files_ok:
-        print("✅ QuTiP demos ready! Qiskit demos require additional installation.")
-        print("\n🚀 You can now run the demos:")
+    if all_deps_ok and qutip_ok and files_ok:
+        if qiskit_ok:
+            print(f"{_icon('🎉')}SUCCESS! Everything is properly installed and ready to use.")
+        else:
+            print(f"{_OK} QuTiP demos ready! Qiskit demos require additional installation.")
+        print(f"\n{_icon('🚀')}You can now run the demos:")
         print("   python utils/run_demos.py")
-        print("\n📚 Or run individual demos:")
-        for demo in demo_files:
+        print(f"\n{_icon('📚')}Or run individual demos:")
+        for demo in _DEMO_FILES:
             if demo.startswith('demos/'):
                 print(f"   python {demo}")
+        if cache_file:
+            _store_result(cache_file, {
+                'ok': True,
+                'fingerprint': fingerprint,
+                'qiskit': qiskit_ok,
+                'python': sys.version,
+                'dependencies': {module: _distribution_version(module) if ok else None
+                                 for module, ok in installed.items()},
+            })
         return True
     else:
-        print("❌ ISSUES DETECTED. Please fix the problems above.")
+        print(f"{_FAIL} ISSUES DETECTED. Please fix the problems above.")
         if not all_deps_ok or not qiskit_ok:
-            print("\n💡 To install missing dependencies:")
+            print(f"\n{_icon('💡')}To install missing dependencies:")
             print("   pip install -r requirements.txt")
         return False
 
 if __name__ == "__main__":
-    success = main()
+    parser = argparse.ArgumentParser(description="Verify the QuTiP demo installation.")
+    parser.add_argument('--strict', action='store_true',
+                        help="also compile the demo files to check their syntax")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="ignore the result of an earlier successful run")
+    parser.add_argument('--verbose', action='store_true',
+                        help="print progress as it happens and full error messages")
+    args = parser.parse_args()
+    success = main(use_cache=not args.no_cache, strict=args.strict,
+                   verbose=args.verbose)
     sys.exit(0 if success else 1)